@@ -0,0 +1,282 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import ta
+
+_PARAMETERS = ["ma", "ema", "rsi", "marsi"]
+
+# Working memory of evaluate() per chunk, and its peak per combination and
+# bar (float64 indicators and equity, boolean signals), as measured with
+# tracemalloc. Chunks shrink as the number of bars grows.
+CHUNK_BYTES = 64 * 2**20
+_BYTES_PER_CELL = 40
+
+# Result columns where a lower value is the better one
+_MINIMIZE = {"max_drawdown"}
+
+
+def parameter_grid(ma, ema, rsi, marsi):
+    """Every (ma, ema, rsi, marsi) combination, one row each."""
+    combinations = itertools.product(ma, ema, rsi, marsi)
+    return pd.DataFrame(list(combinations), columns=_PARAMETERS)
+
+
+class IndicatorBank:
+    """Indicators of the emamarsi strategy for every window of a parameter grid.
+
+    Each distinct window is computed once, with the same indicators as
+    builder.emamarsi, and stored as one row of a 2-D array. A combination of
+    parameters then only gathers its rows, so the work for a grid grows
+    with the number of distinct windows rather than the number of combinations.
+    """
+
+    def __init__(self, close, ma, ema, rsi, marsi):
+        close = pd.Series(np.asarray(close, dtype="float64"))
+        self.close = close.to_numpy()
+        self.windows = {
+            name: np.unique(np.asarray(values, dtype="int64"))
+            for name, values in zip(_PARAMETERS, [ma, ema, rsi, marsi])
+        }
+
+        self.sma = np.array(
+            [
+                ta.trend.SMAIndicator(close, window).sma_indicator().to_numpy()
+                for window in self.windows["ma"]
+            ]
+        )
+        self.ema = np.array(
+            [
+                ta.trend.EMAIndicator(close, window).ema_indicator().to_numpy()
+                for window in self.windows["ema"]
+            ]
+        )
+        rsi_ = pd.DataFrame(
+            {
+                window: ta.momentum.RSIIndicator(close, window).rsi()
+                for window in self.windows["rsi"]
+            }
+        )
+        self.rsi = rsi_.to_numpy().T
+        # marsi[i, j] is the SMA over rsi window i with marsi window j
+        self.marsi = np.array(
+            [
+                ta.panel.sma(rsi_, window).to_numpy().T
+                for window in self.windows["marsi"]
+            ]
+        ).transpose(1, 0, 2)
+        self.price_up = ta.momentum.ROCIndicator(close, 1).roc().to_numpy() > 0
+
+    # Array attributes, in the order they are shared between processes
+    arrays = ("close", "sma", "ema", "rsi", "marsi", "price_up")
+
+    @classmethod
+    def from_arrays(cls, arrays, windows):
+        """Bank over already computed arrays, e.g. views of shared memory."""
+        bank = cls.__new__(cls)
+        bank.windows = windows
+        for name in cls.arrays:
+            setattr(bank, name, arrays[name])
+        return bank
+
+    def __len__(self):
+        return len(self.close)
+
+    def _rows(self, grid, name):
+        return np.searchsorted(self.windows[name], grid[name].to_numpy())
+
+    def signals(self, grid, start=None, stop=None):
+        """Buy and sell signals of every grid row over bars [start, stop).
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray): boolean arrays of shape
+            (len(grid), bars), matching builder.emamarsi row by row.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        # crossed_above/crossed_below compare with the previous bar, which
+        # comes from before `start` when evaluating a later range
+        first = max(start - 1, 0)
+        bars = slice(first, stop)
+        sma_ = self.sma[:, bars][self._rows(grid, "ma")]
+        ema_ = self.ema[:, bars][self._rows(grid, "ema")]
+        rsi_rows = self._rows(grid, "rsi")
+        rsi_ = self.rsi[:, bars][rsi_rows]
+        marsi_ = self.marsi[:, :, bars][rsi_rows, self._rows(grid, "marsi")]
+
+        above = ema_ > sma_
+        below = ema_ < sma_
+        was_at_or_below = np.zeros_like(above)
+        was_at_or_above = np.zeros_like(above)
+        was_at_or_below[:, 1:] = ema_[:, :-1] <= sma_[:, :-1]
+        was_at_or_above[:, 1:] = ema_[:, :-1] >= sma_[:, :-1]
+
+        buy = above & was_at_or_below & (rsi_ > marsi_) & self.price_up[bars]
+        sell = below & was_at_or_above
+        skip = start - first
+        return buy[:, skip:], sell[:, skip:]
+
+
+def _positions(buy, sell):
+    """True while long: from a buy bar up to the bar before the next sell."""
+    # A bar never has both signals, so the position is long exactly when the
+    # latest buy so far is more recent than the latest sell
+    bars = np.arange(buy.shape[1], dtype="int32")
+    last_buy = np.maximum.accumulate(np.where(buy, bars, -1), axis=1)
+    last_sell = np.maximum.accumulate(np.where(sell, bars, -1), axis=1)
+    return last_buy > last_sell
+
+
+def simulate(close, buy, sell):
+    """Long-only trades of every row of buy/sell signals.
+
+    A position opens at the close of a buy bar and closes at the close of
+    the next sell bar; one still open at the end is valued at the last close.
+
+    Args:
+        close(numpy.ndarray): closes of the bars, shape (bars,).
+        buy(numpy.ndarray): boolean, shape (combinations, bars).
+        sell(numpy.ndarray): boolean, shape (combinations, bars).
+
+    Returns:
+        dict: per-combination arrays `trades`, `total_return`, `max_drawdown`.
+    """
+    position = _positions(buy, sell)
+    bar_return = np.zeros(len(close))
+    bar_return[1:] = close[1:] / close[:-1] - 1
+
+    strategy_return = np.zeros(position.shape)
+    strategy_return[:, 1:] = position[:, :-1] * bar_return[1:]
+    equity = np.cumprod(1 + strategy_return, axis=1)
+    drawdown = 1 - equity / np.maximum.accumulate(equity, axis=1)
+
+    entries = position.copy()
+    entries[:, 1:] &= ~position[:, :-1]
+    return {
+        "trades": entries.sum(axis=1),
+        "total_return": equity[:, -1] - 1,
+        "max_drawdown": drawdown.max(axis=1),
+    }
+
+
+def default_chunk_size(bars, budget=CHUNK_BYTES):
+    """Combinations per evaluate() chunk that keep it within `budget` bytes."""
+    return max(1, budget // (_BYTES_PER_CELL * max(bars, 1)))
+
+
+def evaluate(bank, grid, start=None, stop=None, chunk_size=None):
+    """Backtest every row of `grid` over bars [start, stop) of an IndicatorBank.
+
+    Rows are evaluated `chunk_size` at a time as 2-D arrays, which bounds
+    memory without looping over single combinations. By default chunks are
+    sized from the number of bars to stay within CHUNK_BYTES.
+
+    Returns:
+        pandas.DataFrame: `grid` with trades, total_return and max_drawdown.
+    """
+    close = bank.close[slice(start, stop)]
+    chunk_size = chunk_size or default_chunk_size(len(close))
+    results = []
+    for i in range(0, len(grid), chunk_size):
+        chunk = grid.iloc[i : i + chunk_size]
+        buy, sell = bank.signals(chunk, start, stop)
+        results.append(pd.DataFrame(simulate(close, buy, sell), index=chunk.index))
+    if not results:
+        # An empty grid still gets the result columns, with no rows
+        no_signals = np.zeros((0, len(close)), dtype=bool)
+        results.append(pd.DataFrame(simulate(close, no_signals, no_signals)))
+    return grid.join(pd.concat(results))
+
+
+def sweep(close, ma, ema, rsi, marsi, chunk_size=None):
+    """Backtest the emamarsi strategy for every combination of windows.
+
+    Args:
+        close: closing prices in bar order, e.g. BarStore.load(...).close.
+        ma, ema, rsi, marsi: windows to try for each parameter.
+
+    Returns:
+        pandas.DataFrame: one row per (ma, ema, rsi, marsi) combination with
+        its trades, total_return and max_drawdown.
+    """
+    bank = IndicatorBank(close, ma, ema, rsi, marsi)
+    return evaluate(bank, parameter_grid(ma, ema, rsi, marsi), chunk_size=chunk_size)
+
+
+def walk_forward(
+    close,
+    ma,
+    ema,
+    rsi,
+    marsi,
+    in_sample,
+    out_of_sample,
+    step=None,
+    metric="total_return",
+    maximize=None,
+):
+    """Walk-forward optimization of the emamarsi strategy.
+
+    Each fold picks the combination with the best `metric` over
+    `in_sample` bars, then backtests only that combination over the next
+    `out_of_sample` bars. Folds advance by `step` bars, `out_of_sample` by
+    default, so consecutive out-of-sample ranges do not overlap.
+
+    Indicators are computed once over the whole history and every fold reads
+    its range from the same IndicatorBank. They only use past bars, so the
+    values are the ones a fold would compute itself, with earlier bars as
+    warm-up instead of NaN.
+
+    Args:
+        close(pandas.Series): closing prices in bar order.
+        ma, ema, rsi, marsi: windows to try for each parameter.
+        in_sample(int): bars to optimize over.
+        out_of_sample(int): bars to evaluate the chosen combination over.
+        step(int): bars between the starts of consecutive folds.
+        metric(str): result column to optimize in sample.
+        maximize(bool): whether higher `metric` is better; by default False
+            for max_drawdown and True for the other columns.
+
+    Returns:
+        pandas.DataFrame: one row per fold with the first bar of each range,
+        the chosen windows, their in-sample `metric` and their out-of-sample
+        trades, total_return and max_drawdown. No folds fit in `close` when
+        it is shorter than in_sample + out_of_sample; the frame then has the
+        same columns and no rows.
+    """
+    if maximize is None:
+        maximize = metric not in _MINIMIZE
+    columns = [
+        "in_sample_start",
+        "out_of_sample_start",
+        *_PARAMETERS,
+        f"in_sample_{metric}",
+        "trades",
+        "total_return",
+        "max_drawdown",
+    ]
+    step = step or out_of_sample
+    labels = close.index if isinstance(close, pd.Series) else pd.RangeIndex(len(close))
+    bank = IndicatorBank(close, ma, ema, rsi, marsi)
+    grid = parameter_grid(ma, ema, rsi, marsi)
+
+    folds = []
+    for start in range(0, len(bank) - in_sample - out_of_sample + 1, step):
+        split = start + in_sample
+        in_sample_results = evaluate(bank, grid, start, split)
+        scores = in_sample_results[metric]
+        best = scores.idxmax() if maximize else scores.idxmin()
+        out_of_sample_results = evaluate(
+            bank, grid.loc[[best]], split, split + out_of_sample
+        ).iloc[0]
+        folds.append(
+            {
+                "in_sample_start": labels[start],
+                "out_of_sample_start": labels[split],
+                **grid.loc[best].to_dict(),
+                f"in_sample_{metric}": in_sample_results.loc[best, metric],
+                "trades": int(out_of_sample_results.trades),
+                "total_return": out_of_sample_results.total_return,
+                "max_drawdown": out_of_sample_results.max_drawdown,
+            }
+        )
+    return pd.DataFrame(folds, columns=columns)
@@ -0,0 +1,85 @@
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+_COLUMNS = ["time", "open", "high", "low", "close", "volume"]
+_METADATA = ["name", "category", "source"]
+
+# Nominal bar length, used to estimate how many bars are missing
+INTERVAL_SECONDS = {
+    "1m": 60,
+    "5m": 5 * 60,
+    "15m": 15 * 60,
+    "30m": 30 * 60,
+    "1H": 60 * 60,
+    "1D": 24 * 60 * 60,
+    "1W": 7 * 24 * 60 * 60,
+    "1M": 31 * 24 * 60 * 60,
+}
+
+
+class BarStore:
+    """
+    Local OHLCV bar cache, one columnar .npz file per source/symbol/interval.
+
+    Bars are kept sorted and unique on `time`, so callers only need to fetch
+    the bars after the last stored one and merge them in.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, source: str, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, f"{source}_{symbol}_{interval}.npz")
+
+    def load(self, source: str, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        """Stored bars, or None if nothing was stored yet."""
+        try:
+            with np.load(self._path(source, symbol, interval)) as columns:
+                bars = pd.DataFrame({col: columns[col] for col in _COLUMNS})
+                for col in _METADATA:
+                    bars[col] = str(columns[col])
+        except FileNotFoundError:
+            return None
+        return bars
+
+    def save(self, source: str, symbol: str, interval: str, bars: pd.DataFrame):
+        """Replace the stored bars, atomically."""
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(source, symbol, interval)
+        columns = {col: bars[col].to_numpy() for col in _COLUMNS}
+        for col in _METADATA:
+            columns[col] = np.array(bars[col].iloc[-1] if len(bars) else "")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **columns)
+        os.replace(tmp_path, path)
+
+    def merge(
+        self,
+        source: str,
+        symbol: str,
+        interval: str,
+        bars: pd.DataFrame,
+        replace: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Merge freshly fetched bars into the stored ones and save the result.
+
+        A fetched bar replaces a stored bar with the same `time`, since the
+        last stored bar may still have been forming when it was saved. With
+        replace=True the stored bars are discarded instead.
+        """
+        stored = None if replace else self.load(source, symbol, interval)
+        if stored is not None:
+            bars = pd.concat([stored, bars], ignore_index=True)
+        bars = (
+            bars.drop_duplicates(subset="time", keep="last")
+            .sort_values("time")
+            .reset_index(drop=True)
+        )
+        self.save(source, symbol, interval, bars)
+        return bars
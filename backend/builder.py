@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
+import pandas as pd
 import ta
 
+from barstore import INTERVAL_SECONDS
 from const import ACTION_BUY, ACTION_SELL
+from http_session import run_concurrently
 from vci import history as vci_history
 from tcbs import history as tcbs_history
 
@@ -24,10 +27,82 @@ def emamarsi(close, ma, ema, rsi, marsi):
     return sma_, ema_, rsi_, marsi_, buy, sell
 
 
-def data_builder(source, symbol, asset_type, since, to, interval, ma, ema, rsi, marsi):
-    """Build stock data and technical calculations."""
+def emamarsi_panel(close, ma, ema, rsi, marsi):
+    """emamarsi over a wide frame of closes, one column per symbol."""
+    sma_ = ta.panel.sma(close, ma)
+    ema_ = ta.panel.ema(close, ema)
+    rsi_ = ta.panel.rsi(close, rsi)
+    marsi_ = ta.panel.sma(rsi_, marsi)
+
+    price_up = ta.panel.roc(close, 1) > 0
+    rsi_up = rsi_ > marsi_
+    buy = ta.panel.crossed_above(ema_, sma_) & rsi_up & price_up
+    sell = ta.panel.crossed_below(ema_, sma_)
+    return sma_, ema_, rsi_, marsi_, buy, sell
+
+
+class EmaMarsiStream:
+    """emamarsi updated one bar at a time, resumable across processes.
+
+    Bars at or before the last one seen are skipped, so overlapping
+    downloads can be fed in as they come.
+    """
+
+    def __init__(self, ma, ema, rsi, marsi):
+        self.last_time = None
+        self._sma = ta.streaming.SMAStream(ma)
+        self._ema = ta.streaming.EMAStream(ema)
+        self._rsi = ta.streaming.RSIStream(rsi)
+        self._marsi = ta.streaming.SMAStream(marsi)
+        self._roc = ta.streaming.ROCStream(1)
+        self._cross = ta.streaming.CrossoverStream()
+
+    def update(self, time, close):
+        """Add the bar closing at `close`; returns None if it was already seen."""
+        if self.last_time is not None and time <= self.last_time:
+            return None
+        self.last_time = time
+
+        sma_ = self._sma.update(close)
+        ema_ = self._ema.update(close)
+        rsi_ = self._rsi.update(close)
+        marsi_ = self._marsi.update(rsi_)
+
+        price_up = self._roc.update(close) > 0
+        rsi_up = rsi_ > marsi_
+        crossed_above, crossed_below = self._cross.update(ema_, sma_)
+        buy = crossed_above and rsi_up and price_up
+        sell = crossed_below
+        return sma_, ema_, rsi_, marsi_, buy, sell
+
+    def to_dict(self):
+        return {
+            "last_time": None if self.last_time is None else str(self.last_time),
+            "sma": self._sma.to_dict(),
+            "ema": self._ema.to_dict(),
+            "rsi": self._rsi.to_dict(),
+            "marsi": self._marsi.to_dict(),
+            "roc": self._roc.to_dict(),
+            "cross": self._cross.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        stream = cls.__new__(cls)
+        last_time = state["last_time"]
+        stream.last_time = None if last_time is None else pd.Timestamp(last_time)
+        stream._sma = ta.streaming.SMAStream.from_dict(state["sma"])
+        stream._ema = ta.streaming.EMAStream.from_dict(state["ema"])
+        stream._rsi = ta.streaming.RSIStream.from_dict(state["rsi"])
+        stream._marsi = ta.streaming.SMAStream.from_dict(state["marsi"])
+        stream._roc = ta.streaming.ROCStream.from_dict(state["roc"])
+        stream._cross = ta.streaming.CrossoverStream.from_dict(state["cross"])
+        return stream
+
+
+def _download_history(source, symbol, asset_type, since, to, interval):
     if source == "vci":
-        raw_data = vci_history(
+        return vci_history(
             symbol=symbol,
             asset_type=asset_type,
             start=get_past_date(since),
@@ -35,7 +110,7 @@ def data_builder(source, symbol, asset_type, since, to, interval, ma, ema, rsi,
             interval=interval,
         )
     elif source == "tcbs":
-        raw_data = tcbs_history(
+        return tcbs_history(
             symbol=symbol,
             asset_type=asset_type,
             end=get_past_date(to),
@@ -45,17 +120,86 @@ def data_builder(source, symbol, asset_type, since, to, interval, ma, ema, rsi,
     else:
         raise ValueError("Invalid source. Choose 'vci' or 'tcbs'.")
 
-    raw_data = raw_data.set_index("time")
 
-    sma_, ema_, rsi_, marsi_, buy, sell = emamarsi(
-        raw_data.close,
-        ma,
-        ema,
-        rsi,
-        marsi,
+def _leaves_gap(stored, fetched):
+    """Whether fetched and stored bars do not overlap, so merging leaves a hole."""
+    return stored is not None and (
+        fetched.time.iloc[0] > stored.time.iloc[-1]
+        or fetched.time.iloc[-1] < stored.time.iloc[0]
     )
 
-    updated_data = raw_data.join(
+
+def _fetch_missing_bars(store, source, symbol, asset_type, since, to, interval):
+    """Download only the bars `store` lacks, merge them in, and cut the window."""
+    stored = store.load(source, symbol, interval)
+    end = datetime.strptime(get_past_date(to), "%Y-%m-%d")
+
+    if source == "vci":
+        start = datetime.strptime(get_past_date(since), "%Y-%m-%d")
+        end += timedelta(days=1)
+        if stored is None or stored.time.iloc[0].normalize() > start:
+            fetch_since = since
+        else:
+            # Re-fetch from the day of the last stored bar, which may be partial
+            last_day = stored.time.iloc[-1].date()
+            fetch_since = (datetime.today().date() - last_day).days
+    elif source == "tcbs":
+        if stored is not None and end < stored.time.iloc[-1]:
+            # A window ending before the newest stored bar comes from the store
+            # if it holds all of it. Otherwise it is downloaded on its own, as
+            # merging those older bars in would leave a hole after them.
+            window = stored[stored.time <= end].tail(since)
+            if len(window) == since:
+                return window.reset_index(drop=True)
+            return _download_history(source, symbol, asset_type, since, to, interval)
+        if stored is None or len(stored) < since:
+            fetch_since = since
+        else:
+            elapsed = min(end, datetime.now()) - stored.time.iloc[-1]
+            missing = int(elapsed.total_seconds() // INTERVAL_SECONDS[interval])
+            # One bar of overlap refreshes the last stored bar
+            fetch_since = min(since, max(missing, 0) + 2)
+    else:
+        raise ValueError("Invalid source. Choose 'vci' or 'tcbs'.")
+
+    try:
+        fetched = _download_history(
+            source, symbol, asset_type, fetch_since, to, interval
+        )
+    except ValueError:
+        if stored is None:
+            raise
+        # Nothing new since the last stored bar
+        bars = stored
+    else:
+        # After a long downtime the fetched bars may not reach back to the
+        # stored ones. Merging would leave a hole in the series, so the full
+        # window is fetched and, if that still does not reach, replaces them.
+        gap = source == "tcbs" and _leaves_gap(stored, fetched)
+        if gap and fetch_since < since:
+            fetched = _download_history(
+                source, symbol, asset_type, since, to, interval
+            )
+            gap = _leaves_gap(stored, fetched)
+        bars = store.merge(source, symbol, interval, fetched, replace=gap)
+
+    if source == "vci":
+        return bars[(bars.time >= start) & (bars.time < end)].reset_index(drop=True)
+    return bars[bars.time <= end].tail(since).reset_index(drop=True)
+
+
+def _fetch_history(source, symbol, asset_type, since, to, interval, store=None):
+    if store is None:
+        raw_data = _download_history(source, symbol, asset_type, since, to, interval)
+    else:
+        raw_data = _fetch_missing_bars(
+            store, source, symbol, asset_type, since, to, interval
+        )
+    return raw_data.set_index("time")
+
+
+def _join_signals(raw_data, sma_, ema_, rsi_, marsi_, buy, sell):
+    return raw_data.join(
         [
             sma_.rename("sma"),
             ema_.rename("ema"),
@@ -65,6 +209,75 @@ def data_builder(source, symbol, asset_type, since, to, interval, ma, ema, rsi,
             sell.rename("Sell"),
         ]
     )
+
+
+def data_builder(
+    source, symbol, asset_type, since, to, interval, ma, ema, rsi, marsi, store=None
+):
+    """Build stock data and technical calculations.
+
+    With a BarStore, only the bars missing from it are downloaded.
+    """
+    raw_data = _fetch_history(source, symbol, asset_type, since, to, interval, store)
+
+    sma_, ema_, rsi_, marsi_, buy, sell = emamarsi(
+        raw_data.close,
+        ma,
+        ema,
+        rsi,
+        marsi,
+    )
+
+    return _join_signals(raw_data, sma_, ema_, rsi_, marsi_, buy, sell)
+
+
+def data_builder_many(
+    source,
+    symbols,
+    asset_type,
+    since,
+    to,
+    interval,
+    ma,
+    ema,
+    rsi,
+    marsi,
+    store=None,
+    concurrency=8,
+):
+    """Build stock data and technical calculations for several symbols.
+
+    Histories are fetched `concurrency` at a time, and the indicators for all
+    symbols are computed in a single pass over a wide panel of closes.
+    Returns a dict of symbol -> the frame data_builder would build for it.
+    """
+    calls = {
+        symbol: {
+            "source": source,
+            "symbol": symbol,
+            "asset_type": asset_type,
+            "since": since,
+            "to": to,
+            "interval": interval,
+            "store": store,
+        }
+        for symbol in symbols
+    }
+    raw_data = run_concurrently(_fetch_history, calls, concurrency)
+    close = ta.panel.align_by_bar(
+        {symbol: data.close for symbol, data in raw_data.items()}
+    )
+
+    indicators = emamarsi_panel(close, ma, ema, rsi, marsi)
+
+    updated_data = {}
+    for symbol, data in raw_data.items():
+        rows = slice(len(close) - len(data), None)
+        columns = [
+            indicator[symbol].iloc[rows].set_axis(data.index)
+            for indicator in indicators
+        ]
+        updated_data[symbol] = _join_signals(data, *columns)
     return updated_data
 
 
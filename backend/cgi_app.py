@@ -7,6 +7,8 @@ from handlers import (
     get_env,
     get_signals_data,
     get_stocks,
+    get_trades,
+    parse_trade_ratios,
     build_signals,
     trigger_signals,
     filter_stocks,
@@ -15,6 +17,22 @@ from handlers import (
 
 
 def main():
+    query_string = os.environ.get('QUERY_STRING', '')
+    params = dict(param.split('=', 1) for param in query_string.split('&') if '=' in param)
+
+    action = params.get('action', '')
+
+    error = None
+    if action == 'trades':
+        try:
+            ratios = parse_trade_ratios(params.get('sl'), params.get('tp'))
+        except ValueError as e:
+            error = str(e)
+
+    # Invalid parameters get the same 400 as in the Flask app
+    if error is not None:
+        print("Status: 400 Bad Request")
+
     # CORS headers
     print("Content-Type: application/json")
     print("Access-Control-Allow-Origin: *")
@@ -27,17 +45,16 @@ def main():
         print(json.dumps({"message": "CORS preflight"}))
         return
 
-    query_string = os.environ.get('QUERY_STRING', '')
-    params = dict(param.split('=', 1) for param in query_string.split('&') if '=' in param)
-
-    action = params.get('action', '')
-
-    if action == 'env':
+    if error is not None:
+        print(json.dumps({"error": error}))
+    elif action == 'env':
         print(json.dumps(get_env()))
     elif action == 'signals':
         print(json.dumps(get_signals_data()))
     elif action == 'stocks':
         print(json.dumps(get_stocks()))
+    elif action == 'trades':
+        print(json.dumps(get_trades(*ratios)))
     elif action == 'build':
         print(json.dumps(build_signals()))
     elif action == 'trigger':
@@ -5,6 +5,8 @@ load_dotenv()
 
 ENVIRONMENT = os.getenv("ENVIRONMENT")
 NOTIFICATION_MODE = os.getenv("NOTIFICATION_MODE")
+# parquet, feather or csv; columnar formats fall back to csv without pyarrow
+STORAGE_FORMAT = os.getenv("STORAGE_FORMAT", "parquet")
 
 VN30_DISCORD_URL = os.getenv("VN30_DISCORD_URL")
 
@@ -27,5 +29,9 @@ ONESIGNAL_APP_ID = os.getenv("ONESIGNAL_APP_ID")
 ACTION_BUY = "BUY"
 ACTION_SELL = "SELL"
 
+# Stop-loss and take-profit distances, as fractions of the entry price
+SL_RATIO = 0.012
+TP_RATIO = 0.02
+
 TYPE_STOCK = "stock"
 TYPE_DERIVATIVE = "derivative"
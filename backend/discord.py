@@ -1,6 +1,6 @@
-import requests
 import json
 
+import http_session
 from const import (
     ACTION_BUY,
     ACTION_SELL,
@@ -11,7 +11,7 @@ from const import (
 
 
 def send_discord(url, data):
-    return requests.post(
+    return http_session.post(
         url,
         data=json.dumps(data),
         headers={
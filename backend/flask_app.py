@@ -1,10 +1,12 @@
-from flask import Flask
+from flask import Flask, Response, request
 from flask_cors import CORS
 
 from handlers import (
     get_env,
-    get_signals_data,
-    get_stocks,
+    get_signals_json,
+    get_stocks_json,
+    get_trades_json,
+    parse_trade_ratios,
     build_signals,
     trigger_signals,
     filter_stocks,
@@ -15,6 +17,15 @@ app = Flask(__name__)
 CORS(app)
 
 
+def _json_response(body, etag):
+    """JSON response that answers a matching If-None-Match with 304."""
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    # Let browsers keep the body but revalidate it on every request
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
 @app.route("/env")
 def env():
     return get_env()
@@ -22,12 +33,21 @@ def env():
 
 @app.route("/signals")
 def signals():
-    return get_signals_data()
+    return _json_response(*get_signals_json())
 
 
 @app.route("/stocks")
 def stocks():
-    return get_stocks()
+    return _json_response(*get_stocks_json())
+
+
+@app.route("/trades")
+def trades():
+    try:
+        ratios = parse_trade_ratios(request.args.get("sl"), request.args.get("tp"))
+    except ValueError as error:
+        return {"error": str(error)}, 400
+    return _json_response(*get_trades_json(*ratios))
 
 
 @app.route("/build")
@@ -50,5 +70,26 @@ def notify():
     return test_notify()
 
 
+# cgi_app.py actions, so an API_BASE_URL ending in "?action=" keeps working
+_ACTIONS = {
+    "env": env,
+    "signals": signals,
+    "stocks": stocks,
+    "trades": trades,
+    "build": build,
+    "trigger": trigger,
+    "filter": filter,
+    "test-notify": notify,
+}
+
+
+@app.route("/")
+def action():
+    view = _ACTIONS.get(request.args.get("action", ""))
+    if view is None:
+        return {"error": "Unknown or missing action parameter"}
+    return view()
+
+
 if __name__ == "__main__":
     app.run()
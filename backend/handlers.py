@@ -1,14 +1,24 @@
+import hashlib
 import json
-import pytz
-from datetime import datetime
+import math
+from datetime import datetime, timezone
+from functools import lru_cache
 import os
 import time
-from pandas import read_csv
 
-from builder import data_builder, signal_builder
-from const import ENVIRONMENT, TYPE_DERIVATIVE, NOTIFICATION_MODE
+from const import (
+    ENVIRONMENT,
+    NOTIFICATION_MODE,
+    SL_RATIO,
+    STORAGE_FORMAT,
+    TP_RATIO,
+    TYPE_DERIVATIVE,
+)
 from notifications import notify
-from tcbs import stock_screening_insights
+from recordstore import RecordStore
+
+# Modules that pull in pandas, requests or ta are imported where they are
+# used, so requests like ?action=env on the CGI path do not pay for them.
 
 os.environ["TZ"] = "Asia/Ho_Chi_Minh"
 if hasattr(time, "tzset"):
@@ -19,36 +29,80 @@ _VN30 = "VN30F1M"
 start, end, interval = 50, -1, "1H"
 ma, ema, rsi, marsi = 5, 3, 14, 5
 
+# Screening columns served by get_stocks
+_STOCK_COLUMNS = [
+    "ticker",
+    "hasFinancialReport.en",
+    "revenueGrowth1Year",
+    "revenueGrowth5Year",
+    "epsGrowth1Year",
+    "epsGrowth5Year",
+    "lastQuarterProfitGrowth",
+    "secondQuarterProfitGrowth",
+    "netMargin",
+    "profitForTheLast4Quarters",
+    "avgTradingValue5Day",
+    "relativeStrength3Day",
+    "relativeStrength1Month",
+]
+
 current_file_path = os.path.dirname(os.path.abspath(__file__))
-data_file_path = os.path.join(current_file_path, "data.csv")
-all_stocks_file_path = os.path.join(current_file_path, "all.csv")
 time_records_file_path = os.path.join(current_file_path, "time_records.json")
+_time_records = RecordStore(time_records_file_path)
+
+# Serialized API responses: key -> (file signature, JSON bytes, ETag)
+_response_cache = {}
+
+
+@lru_cache(maxsize=None)
+def _table_store():
+    """Store for data.* (latest signals) and all.* (latest screening results)."""
+    from tablestore import TableStore
+
+    return TableStore(current_file_path, STORAGE_FORMAT)
+
+
+@lru_cache(maxsize=None)
+def _bar_store():
+    from barstore import BarStore
+
+    return BarStore(os.path.join(current_file_path, "bars"))
 
 
 def _get_time_records():
-    try:
-        with open(time_records_file_path, "r") as f:
-            time_records = json.load(f)
-    except FileNotFoundError:
-        time_records = {}
-    return time_records
+    return _time_records.get_all()
 
 
 def _set_time_record(entry, value):
+    _time_records.set(entry, value)
+
+
+def _file_signature(path):
     try:
-        with open(time_records_file_path, "r") as f:
-            time_records = json.load(f)
+        stat = os.stat(path)
     except FileNotFoundError:
-        time_records = {}
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
 
-    time_records[entry] = value
 
-    with open(time_records_file_path, "w") as f:
-        json.dump(time_records, f)
+def _cached_json(key, paths, build):
+    """
+    JSON bytes of `build()` and their ETag, cached in memory.
+
+    The cached body is rebuilt when any file in `paths` changes size or mtime,
+    or when a handler that writes those files invalidates `key`.
+    """
+    signature = tuple(_file_signature(path) for path in paths)
+    cached = _response_cache.get(key)
+    if cached is None or cached[0] != signature:
+        body = json.dumps(build()).encode()
+        cached = (signature, body, hashlib.sha1(body).hexdigest())
+        _response_cache[key] = cached
+    return cached[1], cached[2]
 
 
 def _get_current_time():
-    return datetime.now(pytz.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
 
 def get_env():
@@ -63,14 +117,19 @@ def get_env():
         "marsi": marsi,
         "env": ENVIRONMENT,
         "notification_mode": NOTIFICATION_MODE,
+        "sl_ratio": SL_RATIO,
+        "tp_ratio": TP_RATIO,
     }
     return env
 
 
 def get_signals_data():
     try:
-        data = read_csv(data_file_path)
+        data = _table_store().read("data")
         total = len(data)
+        # Columnar formats keep datetimes typed; serve them as CSV did
+        for column in data.select_dtypes("datetime").columns:
+            data[column] = data[column].astype(str)
         data = data.fillna("N/A").to_dict(orient="records")
     except FileNotFoundError:
         total = 0
@@ -86,9 +145,18 @@ def get_signals_data():
     }
 
 
+def get_signals_json():
+    """get_signals_data() as cached JSON bytes, with an ETag."""
+    return _cached_json(
+        "signals",
+        [_table_store().path("data"), time_records_file_path],
+        get_signals_data,
+    )
+
+
 def get_stocks():
     try:
-        stocks = read_csv(all_stocks_file_path)
+        stocks = _table_store().read("all", columns=_STOCK_COLUMNS)
         total = len(stocks)
 
         growth = stocks.loc[
@@ -103,21 +171,7 @@ def get_stocks():
             & (stocks.profitForTheLast4Quarters >= 0)
             & (stocks.avgTradingValue5Day >= 1)
             & True,
-            [
-                "ticker",
-                "hasFinancialReport.en",
-                "revenueGrowth1Year",
-                "revenueGrowth5Year",
-                "epsGrowth1Year",
-                "epsGrowth5Year",
-                "lastQuarterProfitGrowth",
-                "secondQuarterProfitGrowth",
-                "netMargin",
-                "profitForTheLast4Quarters",
-                "avgTradingValue5Day",
-                "relativeStrength3Day",
-                "relativeStrength1Month",
-            ],
+            _STOCK_COLUMNS,
         ]
         filtered_stocks = growth.fillna("N/A").to_dict(orient="records")
     except FileNotFoundError:
@@ -134,7 +188,75 @@ def get_stocks():
     }
 
 
+def get_stocks_json():
+    """get_stocks() as cached JSON bytes, with an ETag."""
+    return _cached_json(
+        "stocks",
+        [_table_store().path("all"), time_records_file_path],
+        get_stocks,
+    )
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return math.nan
+
+
+def parse_trade_ratios(sl_ratio=None, tp_ratio=None):
+    """
+    Stop-loss and take-profit ratios from request parameters.
+
+    Missing values fall back to SL_RATIO and TP_RATIO. Raises ValueError unless
+    0 < sl_ratio < 1 and 0 < tp_ratio, both finite.
+    """
+    sl_ratio = SL_RATIO if sl_ratio is None else _to_float(sl_ratio)
+    tp_ratio = TP_RATIO if tp_ratio is None else _to_float(tp_ratio)
+    if not (math.isfinite(sl_ratio) and 0 < sl_ratio < 1):
+        raise ValueError("sl must be a number between 0 and 1")
+    if not (math.isfinite(tp_ratio) and tp_ratio > 0):
+        raise ValueError("tp must be a positive number")
+    return sl_ratio, tp_ratio
+
+
+def get_trades(sl_ratio=SL_RATIO, tp_ratio=TP_RATIO):
+    """Trades of the latest signals, exiting on stop-loss, take-profit or Sell."""
+    from trades import trade_list, trade_summary
+
+    try:
+        data = _table_store().read("data")
+    except FileNotFoundError:
+        return {"total": 0, "trades": [], "summary": {}}
+
+    trades = trade_list(data, sl_ratio, tp_ratio)
+    for column in trades.select_dtypes("datetime").columns:
+        trades[column] = trades[column].astype(str)
+    return {
+        "total": len(trades),
+        "trades": trades.to_dict(orient="records"),
+        "summary": trade_summary(trades),
+    }
+
+
+def get_trades_json(sl_ratio=SL_RATIO, tp_ratio=TP_RATIO):
+    """
+    get_trades() as JSON bytes, with an ETag.
+
+    Only the default ratios are cached, so arbitrary sl/tp parameters cannot
+    grow the cache of a long-lived worker.
+    """
+    if (sl_ratio, tp_ratio) != (SL_RATIO, TP_RATIO):
+        body = json.dumps(get_trades(sl_ratio, tp_ratio)).encode()
+        return body, hashlib.sha1(body).hexdigest()
+    return _cached_json(
+        "trades", [_table_store().path("data")], lambda: get_trades(SL_RATIO, TP_RATIO)
+    )
+
+
 def build_signals():
+    from builder import data_builder, signal_builder
+
     data = data_builder(
         "tcbs",
         _VN30,
@@ -146,12 +268,15 @@ def build_signals():
         ema,
         rsi,
         marsi,
+        store=_bar_store(),
     )
 
     triggered, pkg = signal_builder(_VN30, data)
 
-    data.to_csv(data_file_path)
+    _table_store().write("data", data)
     _set_time_record("last_triggered", _get_current_time())
+    _response_cache.pop("signals", None)
+    _response_cache.pop("trades", None)
     return {
         "triggered": triggered,
         **pkg,
@@ -179,9 +304,12 @@ def trigger_signals():
 
 
 def filter_stocks():
+    from tcbs import stock_screening_insights
+
     all = stock_screening_insights({"exchangeName": "HOSE,HNX,UPCOM"})
-    all.to_csv(all_stocks_file_path)
+    _table_store().write("all", all)
     _set_time_record("last_filtered", _get_current_time())
+    _response_cache.pop("stocks", None)
     return {
         "total": len(all),
         "message": f"[{_get_current_time()}] Filtered data saved.",
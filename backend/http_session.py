@@ -0,0 +1,181 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Hashable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster JSON decoder
+    orjson = None
+
+
+# (connect, read) timeouts in seconds
+TIMEOUT = (5, 30)
+
+# Reads are safe to repeat, including provider reads sent as POST, which opt
+# in per call with idempotent=True.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Other POSTs, such as notifications, may already have been delivered when a
+# read times out or a gateway answers 5xx, so only requests that never reached
+# the server (connect errors) or were rejected with 429 are sent again.
+_SEND_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    other=0,
+    backoff_factor=0.5,
+    status_forcelist=(429,),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_sessions = {}
+_session_lock = threading.Lock()
+
+
+def get_session(idempotent: bool = True) -> requests.Session:
+    """Shared session with pooled keep-alive connections and retries.
+
+    Requests that are safe to repeat share one session retried on 429 and 5xx;
+    the others share one retried only on connect errors and 429.
+    """
+    session = _sessions.get(idempotent)
+    if session is None:
+        with _session_lock:
+            session = _sessions.get(idempotent)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=8,
+                    pool_maxsize=16,
+                    max_retries=_RETRY if idempotent else _SEND_RETRY,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _sessions[idempotent] = session
+    return session
+
+
+def parse_json(response: requests.Response):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def request(
+    method: str, url: str, idempotent: Optional[bool] = None, **kwargs
+) -> requests.Response:
+    """Send a request; only GET is treated as safe to retry unless `idempotent`."""
+    if idempotent is None:
+        idempotent = method == "GET"
+    kwargs.setdefault("timeout", TIMEOUT)
+    return get_session(idempotent).request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, idempotent: bool = False, **kwargs) -> requests.Response:
+    return request("POST", url, idempotent=idempotent, **kwargs)
+
+
+class RateLimiter:
+    """Spaces out calls to one host to at most `rate` per second."""
+
+    def __init__(self, rate: Optional[float] = None):
+        self._interval = 1.0 / rate if rate else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def gather_limited(
+    function: Callable,
+    calls: Dict[Hashable, dict],
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    raise_errors: bool = True,
+) -> dict:
+    """
+    Run the blocking `function(**kwargs)` for every entry of `calls` concurrently.
+
+    Each call runs on a worker thread over the shared pooled session. At most
+    `concurrency` calls are in flight, and at most `rate_limit` start per second.
+    Returns a dict with the same keys as `calls`. With raise_errors=False,
+    calls that failed are left out instead of raising.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate_limit)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        async def _call(kwargs):
+            async with semaphore:
+                await limiter.wait()
+                return await loop.run_in_executor(
+                    executor, partial(function, **kwargs)
+                )
+
+        keys = list(calls)
+        results = await asyncio.gather(
+            *(_call(calls[key]) for key in keys), return_exceptions=not raise_errors
+        )
+    return {
+        key: result
+        for key, result in zip(keys, results)
+        if not isinstance(result, Exception)
+    }
+
+
+def require_no_running_loop(caller: str, alternative: str) -> None:
+    """Raise RuntimeError if called from a running event loop.
+
+    Blocking wrappers call this before building their coroutine, so the
+    error names the coroutine to await instead and nothing is left unawaited.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise RuntimeError(
+        f"{caller} cannot be called from a running event loop; "
+        f"await {alternative} instead"
+    )
+
+
+def run_concurrently(
+    function: Callable,
+    calls: Dict[Hashable, dict],
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    raise_errors: bool = True,
+) -> dict:
+    """Blocking entry point to gather_limited, for callers without an event loop."""
+    require_no_running_loop("run_concurrently()", "gather_limited()")
+    return asyncio.run(
+        gather_limited(function, calls, concurrency, rate_limit, raise_errors)
+    )
@@ -0,0 +1,108 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+
+BOOTSTRAP = "bootstrap"
+PERMUTATION = "permutation"
+
+# Resamples drawn from each seed; results do not depend on the process count
+# because the blocks and their seeds are the same however they are scheduled
+_BLOCK = 500
+
+# Set in each worker by _init_worker
+_worker_returns = None
+
+
+def _resample(returns, rng, size, method):
+    """Total return and max drawdown of `size` resampled trade sequences.
+
+    Every sequence is a row of one 2-D array, so equity curves and drawdowns
+    for the whole block come from a few array operations.
+    """
+    if method == BOOTSTRAP:
+        samples = returns[rng.integers(0, len(returns), (size, len(returns)))]
+    elif method == PERMUTATION:
+        samples = rng.permuted(np.broadcast_to(returns, (size, len(returns))), axis=1)
+    else:
+        raise ValueError(f"Unknown resampling method: {method}")
+
+    equity = np.exp(np.cumsum(np.log1p(samples), axis=1))
+    # Equity starts at 1, which is the first peak, as in trades.trade_summary
+    peak = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+    return {
+        "total_return": equity[:, -1] - 1,
+        "max_drawdown": (1 - equity / peak).max(axis=1),
+    }
+
+
+def _init_worker(returns):
+    global _worker_returns
+    _worker_returns = returns
+
+
+def _resample_block(task):
+    seed, size, method = task
+    return _resample(_worker_returns, np.random.default_rng(seed), size, method)
+
+
+def monte_carlo(trades, resamples=10000, method=BOOTSTRAP, processes=None, seed=None):
+    """Resample a trade list to estimate the spread of its returns and drawdown.
+
+    `bootstrap` draws trades with replacement, so both total return and
+    drawdown vary. `permutation` reshuffles the same trades, so total return
+    is fixed and only the drawdown, which depends on their order, varies.
+
+    Resamples are split into blocks, each drawn from its own child of
+    `seed` (numpy SeedSequence.spawn), and blocks are spread over a process
+    pool. The same seed gives the same results for any number of processes.
+
+    Args:
+        trades(pandas.DataFrame): trades.trade_list output, or any frame with
+            a `return` column of per-trade returns.
+        resamples(int): number of resampled trade sequences.
+        method(str): `bootstrap` or `permutation`.
+        processes(int): worker processes; defaults to the CPU count.
+        seed(int): entropy for the SeedSequence; None draws fresh entropy.
+
+    Returns:
+        pandas.DataFrame: total_return and max_drawdown, one row per resample.
+    """
+    returns = trades["return"].to_numpy(dtype="float64")
+    if not len(returns) or resamples <= 0:
+        return pd.DataFrame(columns=["total_return", "max_drawdown"], dtype="float64")
+
+    sizes = [min(_BLOCK, resamples - i) for i in range(0, resamples, _BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(seed_, size, method) for seed_, size in zip(seeds, sizes)]
+
+    processes = min(processes or os.cpu_count() or 1, len(tasks))
+    if processes <= 1:
+        _init_worker(returns)
+        results = [_resample_block(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(
+            processes, initializer=_init_worker, initargs=(returns,)
+        ) as pool:
+            results = pool.map(_resample_block, tasks)
+
+    return pd.DataFrame(
+        {
+            column: np.concatenate([result[column] for result in results])
+            for column in ["total_return", "max_drawdown"]
+        }
+    )
+
+
+def monte_carlo_summary(samples, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95)):
+    """Mean, chosen quantiles and probability of a loss of monte_carlo() output.
+
+    Returns:
+        pandas.DataFrame: one row per statistic, one column per metric.
+    """
+    summary = samples.quantile(list(quantiles))
+    summary.index = [f"p{quantile * 100:g}" for quantile in quantiles]
+    summary.loc["mean"] = samples.mean()
+    summary.loc["probability_of_loss"] = [(samples.total_return < 0).mean(), np.nan]
+    return summary
@@ -1,10 +1,9 @@
-import requests
-
+import http_session
 from const import ONESIGNAL_API_KEY, ONESIGNAL_API_URL, ONESIGNAL_APP_ID
 
 
 def send_onesignal_notification(payload):
-    return requests.post(
+    return http_session.post(
         ONESIGNAL_API_URL,
         json=payload,
         headers={
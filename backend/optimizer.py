@@ -0,0 +1,128 @@
+import math
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from backtest import IndicatorBank, default_chunk_size, evaluate, parameter_grid
+
+# Chunks handed to each worker, so faster workers pick up the slack
+_CHUNKS_PER_PROCESS = 4
+
+# Set in each worker by _init_worker
+_worker_memory = None
+_worker_bank = None
+
+
+def _share_bank(bank):
+    """Copy the bank's arrays into one shared memory block.
+
+    Returns the block and its layout: name -> (offset, shape, dtype).
+    """
+    layout = {}
+    size = 0
+    for name in IndicatorBank.arrays:
+        array = getattr(bank, name)
+        layout[name] = (size, array.shape, array.dtype.str)
+        # Keep every array 8-byte aligned
+        size += -(-array.nbytes // 8) * 8
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for name, array in _attach_arrays(memory, layout).items():
+        array[...] = getattr(bank, name)
+    return memory, layout
+
+
+def _attach_arrays(memory, layout):
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset)
+        for name, (offset, shape, dtype) in layout.items()
+    }
+
+
+def _init_worker(memory_name, layout, windows):
+    global _worker_memory, _worker_bank
+    # Pool workers share the parent's resource tracker, so attaching does not
+    # register the block a second time; the parent unlinks it when done.
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    _worker_bank = IndicatorBank.from_arrays(
+        _attach_arrays(_worker_memory, layout), windows
+    )
+
+
+def _evaluate_chunk(grid):
+    return evaluate(_worker_bank, grid)
+
+
+def optimize(close, ma, ema, rsi, marsi, processes=None, chunk_size=None):
+    """Backtest every (ma, ema, rsi, marsi) combination across CPU cores.
+
+    The indicator bank is computed once in this process and placed in shared
+    memory. Workers attach to it instead of receiving pickled prices, and
+    each evaluates blocks of the parameter grid with backtest.evaluate.
+
+    Args:
+        close: closing prices in bar order.
+        ma, ema, rsi, marsi: windows to try for each parameter.
+        processes(int): worker processes; defaults to the CPU count.
+        chunk_size(int): maximum combinations per task; by default sized
+            from the number of bars like backtest.evaluate.
+
+    Returns:
+        pandas.DataFrame: the same as backtest.sweep.
+    """
+    processes = processes or os.cpu_count() or 1
+    bank = IndicatorBank(close, ma, ema, rsi, marsi)
+    grid = parameter_grid(ma, ema, rsi, marsi)
+    if processes == 1 or grid.empty:
+        return evaluate(bank, grid, chunk_size=chunk_size)
+
+    chunk_size = min(
+        chunk_size or default_chunk_size(len(bank)),
+        math.ceil(len(grid) / (processes * _CHUNKS_PER_PROCESS)),
+    )
+    chunks = [grid.iloc[i : i + chunk_size] for i in range(0, len(grid), chunk_size)]
+
+    memory, layout = _share_bank(bank)
+    try:
+        with multiprocessing.Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(memory.name, layout, bank.windows),
+        ) as pool:
+            results = pool.map(_evaluate_chunk, chunks)
+    finally:
+        memory.close()
+        memory.unlink()
+    return pd.concat(results)
+
+
+def scaling_report(close, ma, ema, rsi, marsi, process_counts=None):
+    """Time optimize() for several worker counts.
+
+    Efficiency is the speedup over one process divided by the number of
+    processes; values well below 1 mean extra cores are not paying off.
+
+    Returns:
+        pandas.DataFrame: processes, seconds, speedup and efficiency.
+    """
+    if process_counts is None:
+        cpus = os.cpu_count() or 1
+        process_counts = sorted({2**i for i in range(cpus.bit_length())} | {cpus})
+
+    rows = []
+    for processes in process_counts:
+        started = time.perf_counter()
+        optimize(close, ma, ema, rsi, marsi, processes=processes)
+        rows.append(
+            {"processes": processes, "seconds": time.perf_counter() - started}
+        )
+
+    report = pd.DataFrame(rows)
+    baseline = report.seconds[report.processes == 1]
+    baseline = baseline.iloc[0] if len(baseline) else np.nan
+    report["speedup"] = baseline / report.seconds
+    report["efficiency"] = report.speedup / report.processes
+    return report
@@ -0,0 +1,74 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; writes are then only atomic
+    fcntl = None
+
+
+class RecordStore:
+    """
+    Small JSON key/value file shared by concurrent processes.
+
+    Updates hold an exclusive lock on a sibling .lock file while they read,
+    modify and rewrite the records, so concurrent writers cannot lose each
+    other's entries. The new file is written aside and renamed into place,
+    so readers never see a partly written file and need no lock. Reads are
+    served from memory until the file's mtime or size changes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._cached = None
+
+    @contextmanager
+    def _locked(self):
+        with self._thread_lock, open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _signature(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def get_all(self) -> dict:
+        """All records, as a dict the caller may modify."""
+        signature = self._signature()
+        cached = self._cached
+        if cached is None or cached[0] != signature:
+            cached = (signature, self._load())
+            self._cached = cached
+        return dict(cached[1])
+
+    def get(self, entry: str, default=None):
+        return self.get_all().get(entry, default)
+
+    def set(self, entry: str, value):
+        """Set one record, keeping every other record as currently stored."""
+        with self._locked():
+            records = self._load()
+            records[entry] = value
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(records, f)
+            os.replace(tmp_path, self.path)
+            self._cached = (self._signature(), records)
@@ -2,17 +2,13 @@
 engineering from financial time series datasets (Open,
 Close, High, Low, Volume). It is built on Pandas and Numpy.
 
+Submodules and the ``add_*`` wrappers are imported on first access, so
+``import ta`` is cheap and using a few indicators only loads their modules.
+
 .. moduleauthor:: Dario Lopez Padial (Bukosabino)
 
 """
-from ta.wrapper import (
-    add_all_ta_features,
-    add_momentum_ta,
-    add_others_ta,
-    add_trend_ta,
-    add_volatility_ta,
-    add_volume_ta,
-)
+import importlib
 
 __all__ = [
     "add_all_ta_features",
@@ -22,3 +18,27 @@ __all__ = [
     "add_volatility_ta",
     "add_volume_ta",
 ]
+
+_SUBMODULES = {
+    "momentum",
+    "others",
+    "panel",
+    "streaming",
+    "trend",
+    "utils",
+    "volatility",
+    "volume",
+    "wrapper",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"ta.{name}")
+    if name in __all__:
+        return getattr(importlib.import_module("ta.wrapper"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(__all__))
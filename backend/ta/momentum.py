@@ -8,7 +8,7 @@
 import numpy as np
 import pandas as pd
 
-from ta.utils import IndicatorMixin, _ema
+from ta.utils import IndicatorMixin, _ema, _linear_filter
 
 
 class RSIIndicator(IndicatorMixin):
@@ -333,20 +333,19 @@ class KAMAIndicator(IndicatorMixin):
             ** 2.0
         ).values
 
-        self._kama = np.zeros(smoothing_constant.size)
-        len_kama = len(self._kama)
-        first_value = True
-
-        for i in range(len_kama):
-            if np.isnan(smoothing_constant[i]):
-                self._kama[i] = np.nan
-            elif first_value:
-                self._kama[i] = close_values[i]
-                first_value = False
-            else:
-                self._kama[i] = self._kama[i - 1] + smoothing_constant[i] * (
-                    close_values[i] - self._kama[i - 1]
-                )
+        # KAMA starts at the close of the first bar with a smoothing constant,
+        # then follows kama += sc * (close - kama) as a first-order filter.
+        self._kama = np.full(smoothing_constant.size, np.nan)
+        valid = np.flatnonzero(~np.isnan(smoothing_constant))
+        if len(valid) > 0:
+            first = valid[0]
+            self._kama[first] = close_values[first]
+            smoothing_constant = smoothing_constant[first + 1 :]
+            self._kama[first + 1 :] = _linear_filter(
+                1.0 - smoothing_constant,
+                smoothing_constant * close_values[first + 1 :],
+                close_values[first],
+            )
 
     def kama(self) -> pd.Series:
         """Kaufman's Adaptive Moving Average (KAMA)
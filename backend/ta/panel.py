@@ -0,0 +1,133 @@
+"""
+.. module:: panel
+   :synopsis: Indicators over many tickers in one pass.
+
+Every function takes a wide DataFrame with one column per ticker and one row
+per bar, and returns a frame of the same shape. Each column gives the same
+values as the matching single-series indicator. The whole panel is computed
+by one rolling/ewm call instead of one Python-level pass per ticker.
+
+"""
+import typing as tp
+
+import numpy as np
+import pandas as pd
+
+from ta.utils import _ema, _sma
+from ta.utils import crossed_above as _crossed_above
+from ta.utils import crossed_below as _crossed_below
+
+
+def _check_fillna(frame: pd.DataFrame, fillna: bool, value: int = 0) -> pd.DataFrame:
+    if fillna:
+        frame = frame.replace([np.inf, -np.inf], np.nan).ffill().fillna(value)
+    return frame
+
+
+def align_by_bar(series: tp.Dict[str, pd.Series]) -> pd.DataFrame:
+    """Wide frame of per-ticker series aligned on their last bar.
+
+    Tickers rarely share every timestamp, so the columns are aligned by bar
+    position instead of by time. Shorter histories are padded with NaN at the
+    top, which keeps each column's indicators equal to the single-series ones.
+
+    Args:
+        series(dict): ticker -> pandas.Series of values in bar order.
+
+    Returns:
+        pandas.DataFrame: one column per ticker, indexed by bar position.
+    """
+    length = max((len(values) for values in series.values()), default=0)
+    columns = {}
+    for ticker, values in series.items():
+        column = np.full(length, np.nan)
+        column[length - len(values) :] = values.to_numpy(dtype="float64")
+        columns[ticker] = column
+    return pd.DataFrame(columns, index=pd.RangeIndex(length))
+
+
+def sma(close: pd.DataFrame, window: int, fillna: bool = False) -> pd.DataFrame:
+    """Simple Moving Average (SMA) of every column.
+
+    Args:
+        close(pandas.DataFrame): 'Close' values, one column per ticker.
+        window(int): n period.
+        fillna(bool): if True, fill nan values.
+
+    Returns:
+        pandas.DataFrame: New features generated.
+    """
+    return _sma(close, window, fillna)
+
+
+def ema(close: pd.DataFrame, window: int = 14, fillna: bool = False) -> pd.DataFrame:
+    """Exponential Moving Average (EMA) of every column.
+
+    Args:
+        close(pandas.DataFrame): 'Close' values, one column per ticker.
+        window(int): n period.
+        fillna(bool): if True, fill nan values.
+
+    Returns:
+        pandas.DataFrame: New features generated.
+    """
+    return _ema(close, window, fillna)
+
+
+def rsi(close: pd.DataFrame, window: int = 14, fillna: bool = False) -> pd.DataFrame:
+    """Relative Strength Index (RSI) of every column.
+
+    Args:
+        close(pandas.DataFrame): 'Close' values, one column per ticker.
+        window(int): n period.
+        fillna(bool): if True, fill nan values.
+
+    Returns:
+        pandas.DataFrame: New features generated.
+    """
+    diff = close.diff(1)
+    # Padding above a ticker's first bar must stay NaN rather than count as a
+    # flat bar, so the smoothing starts on the same bar as for a single series.
+    started = close.notna().cummax()
+    up_direction = diff.where(diff > 0, 0.0).where(started)
+    down_direction = -diff.where(diff < 0, 0.0).where(started)
+    min_periods = 0 if fillna else window
+    emaup = up_direction.ewm(
+        alpha=1 / window, min_periods=min_periods, adjust=False
+    ).mean()
+    emadn = down_direction.ewm(
+        alpha=1 / window, min_periods=min_periods, adjust=False
+    ).mean()
+    relative_strength = emaup / emadn
+    rsi_ = pd.DataFrame(
+        np.where(emadn == 0, 100, 100 - (100 / (1 + relative_strength))),
+        index=close.index,
+        columns=close.columns,
+    )
+    return _check_fillna(rsi_, fillna, value=50)
+
+
+def roc(close: pd.DataFrame, window: int = 12, fillna: bool = False) -> pd.DataFrame:
+    """Rate of Change (ROC) of every column.
+
+    Args:
+        close(pandas.DataFrame): 'Close' values, one column per ticker.
+        window(int): n periods.
+        fillna(bool): if True, fill nan values.
+
+    Returns:
+        pandas.DataFrame: New features generated.
+    """
+    shifted = close.shift(window)
+    roc_ = ((close - shifted) / shifted) * 100
+    return _check_fillna(roc_, fillna)
+
+
+def crossed_above(frame1: pd.DataFrame, frame2: pd.DataFrame) -> pd.DataFrame:
+    """Check, column by column, if frame1 crossed above frame2"""
+    return _crossed_above(frame1, frame2)
+
+
+def crossed_below(frame1: pd.DataFrame, frame2: pd.DataFrame) -> pd.DataFrame:
+    """Check, column by column, if frame1 crossed below frame2"""
+    return _crossed_below(frame1, frame2)
@@ -0,0 +1,250 @@
+"""
+.. module:: streaming
+   :synopsis: Incremental indicators, updated one bar at a time.
+
+Each class keeps just enough state to produce the next value in O(1) and
+gives the same values as the matching batch indicator over the same bars.
+The state can be saved with ``to_dict()``, which is JSON serializable, and
+restored with ``from_dict()``, so a short-lived process can resume where the
+previous one stopped.
+
+"""
+import functools
+import math
+from collections import deque
+
+
+@functools.lru_cache(maxsize=None)
+def _pandas_refills_gap_weight() -> bool:
+    """Whether pandas' ewm(alpha=0.5, adjust=False) gives the value after a NaN
+    gap the weight the average lost over the gap, as pandas 3 does, rather
+    than alpha. Checked once, on first need, so importing stays cheap."""
+    import pandas as pd
+
+    ewm = pd.Series([0.0, math.nan, 1.0]).ewm(alpha=0.5, adjust=False).mean()
+    return bool(ewm.iloc[-1] == 0.75)
+
+
+class _Stream:
+    """Util base class for streaming indicators"""
+
+    _fields: tuple = ()
+
+    def to_dict(self) -> dict:
+        """Indicator state as a JSON serializable dict."""
+        state = {}
+        for field in self._fields:
+            value = getattr(self, f"_{field}")
+            state[field] = list(value) if isinstance(value, deque) else value
+        return state
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        """Restore an indicator saved with ``to_dict()``."""
+        stream = cls.__new__(cls)
+        for field in cls._fields:
+            setattr(stream, f"_{field}", state[field])
+        stream._restore()
+        return stream
+
+    def _restore(self):
+        pass
+
+
+class SMAStream(_Stream):
+    """SMA - Simple Moving Average, updated one value at a time.
+
+    Matches ``SMAIndicator(close, window).sma_indicator()``: the average is
+    NaN until the last `window` values are all valid.
+
+    Args:
+        window(int): n period.
+    """
+
+    _fields = ("window", "values", "total", "valid")
+
+    def __init__(self, window: int):
+        self._window = window
+        self._values = deque(maxlen=window)
+        self._total = 0.0
+        self._valid = 0
+
+    def _restore(self):
+        self._values = deque(self._values, maxlen=self._window)
+
+    def update(self, value: float) -> float:
+        """Add the next value and return the updated SMA."""
+        if len(self._values) == self._window:
+            dropped = self._values[0]
+            if not math.isnan(dropped):
+                self._total -= dropped
+                self._valid -= 1
+        self._values.append(value)
+        if not math.isnan(value):
+            self._total += value
+            self._valid += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        """Current SMA."""
+        if self._valid < self._window:
+            return math.nan
+        return self._total / self._window
+
+
+class EMAStream(_Stream):
+    """EMA - Exponential Moving Average, updated one value at a time.
+
+    Matches ``EMAIndicator(close, window).ema_indicator()``, including after
+    NaN values: like pandas, the EMA keeps its value over a gap, and its
+    weight against the next valid value decays with every bar of the gap.
+
+    Args:
+        window(int): n period.
+    """
+
+    _fields = ("window", "ema", "weight", "count")
+
+    def __init__(self, window: int = 14):
+        self._window = window
+        self._ema = math.nan
+        # Weight left to the current EMA, decayed once per bar
+        self._weight = 1.0
+        self._count = 0
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        # States saved before the gap weight was kept had none, which is the
+        # same as no NaN since the last valid value
+        return super().from_dict({"weight": 1.0, **state})
+
+    def update(self, value: float) -> float:
+        """Add the next value and return the updated EMA."""
+        if self._count == 0:
+            if not math.isnan(value):
+                self._ema = value
+                self._count = 1
+            return self.value
+
+        alpha = 2.0 / (self._window + 1)
+        self._weight *= 1 - alpha
+        if not math.isnan(value):
+            new_weight = alpha
+            if alpha == 0.5 and _pandas_refills_gap_weight():
+                new_weight = 1 - self._weight
+            self._ema = (self._weight * self._ema + new_weight * value) / (
+                self._weight + new_weight
+            )
+            self._weight = 1.0
+            self._count += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        """Current EMA."""
+        if self._count < self._window:
+            return math.nan
+        return self._ema
+
+
+class RSIStream(_Stream):
+    """RSI - Relative Strength Index, updated one close at a time.
+
+    Matches ``RSIIndicator(close, window).rsi()``.
+
+    Args:
+        window(int): n period.
+    """
+
+    _fields = ("window", "prev_close", "emaup", "emadn", "count")
+
+    def __init__(self, window: int = 14):
+        self._window = window
+        self._prev_close = None
+        self._emaup = 0.0
+        self._emadn = 0.0
+        self._count = 0
+
+    def update(self, close: float) -> float:
+        """Add the next close and return the updated RSI."""
+        diff = math.nan if self._prev_close is None else close - self._prev_close
+        up_direction = diff if diff > 0 else 0.0
+        down_direction = -diff if diff < 0 else 0.0
+        if self._count == 0:
+            self._emaup = up_direction
+            self._emadn = down_direction
+        else:
+            alpha = 1.0 / self._window
+            self._emaup = (1 - alpha) * self._emaup + alpha * up_direction
+            self._emadn = (1 - alpha) * self._emadn + alpha * down_direction
+        self._count += 1
+        self._prev_close = close
+        return self.value
+
+    @property
+    def value(self) -> float:
+        """Current RSI."""
+        if self._count < self._window:
+            return math.nan
+        if self._emadn == 0:
+            return 100.0
+        return 100 - (100 / (1 + self._emaup / self._emadn))
+
+
+class ROCStream(_Stream):
+    """ROC - Rate of Change, updated one close at a time.
+
+    Matches ``ROCIndicator(close, window).roc()``.
+
+    Args:
+        window(int): n period.
+    """
+
+    _fields = ("window", "closes")
+
+    def __init__(self, window: int = 12):
+        self._window = window
+        self._closes = deque(maxlen=window + 1)
+
+    def _restore(self):
+        self._closes = deque(self._closes, maxlen=self._window + 1)
+
+    def update(self, close: float) -> float:
+        """Add the next close and return the updated ROC."""
+        self._closes.append(close)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        """Current ROC."""
+        if len(self._closes) <= self._window:
+            return math.nan
+        previous = self._closes[0]
+        return ((self._closes[-1] - previous) / previous) * 100
+
+
+class CrossoverStream(_Stream):
+    """Crossovers of two series, updated one pair of values at a time.
+
+    Matches ``crossed_above(series1, series2)`` and
+    ``crossed_below(series1, series2)``.
+    """
+
+    _fields = ("prev1", "prev2")
+
+    def __init__(self):
+        self._prev1 = math.nan
+        self._prev2 = math.nan
+
+    def update(self, value1: float, value2: float) -> tuple:
+        """Add the next pair of values.
+
+        Returns:
+            tuple(bool, bool): whether series1 crossed above and below series2.
+        """
+        above = value1 > value2 and self._prev1 <= self._prev2
+        below = value1 < value2 and self._prev1 >= self._prev2
+        self._prev1 = value1
+        self._prev2 = value2
+        return above, below
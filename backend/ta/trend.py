@@ -8,7 +8,17 @@
 import numpy as np
 import pandas as pd
 
-from ta.utils import IndicatorMixin, _ema, _get_min_max, _sma
+from ta.utils import (
+    IndicatorMixin,
+    _ema,
+    _get_min_max,
+    _jit,
+    _rolling_arg_extreme,
+    _rolling_mad,
+    _rolling_weighted_sum,
+    _sma,
+    _wilder_smoothing,
+)
 
 
 class AroonIndicator(IndicatorMixin):
@@ -42,15 +52,15 @@ class AroonIndicator(IndicatorMixin):
         # Note: window-size + current time point = self._window + 1
         min_periods = 1 if self._fillna else self._window + 1
 
-        rolling_high = self._high.rolling(self._window + 1, min_periods=min_periods)
-        self._aroon_up = rolling_high.apply(
-            lambda x: float(np.argmax(x)) / self._window * 100, raw=True
+        high_position = _rolling_arg_extreme(
+            self._high, self._window + 1, min_periods, "max"
         )
+        self._aroon_up = high_position / self._window * 100
 
-        rolling_low = self._low.rolling(self._window + 1, min_periods=min_periods)
-        self._aroon_down = rolling_low.apply(
-            lambda x: float(np.argmin(x)) / self._window * 100, raw=True
+        low_position = _rolling_arg_extreme(
+            self._low, self._window + 1, min_periods, "min"
         )
+        self._aroon_down = low_position / self._window * 100
 
     def aroon_up(self) -> pd.Series:
         """Aroon Up Channel
@@ -219,22 +229,13 @@ class WMAIndicator(IndicatorMixin):
         self._run()
 
     def _run(self):
-        _weight = pd.Series(
+        _weight = np.array(
             [
                 i * 2 / (self._window * (self._window + 1))
                 for i in range(1, self._window + 1)
             ]
         )
-
-        def weighted_average(weight):
-            def _weighted_average(x):
-                return (weight * x).sum()
-
-            return _weighted_average
-
-        self._wma = self._close.rolling(self._window).apply(
-            weighted_average(_weight), raw=True
-        )
+        self._wma = _rolling_weighted_sum(self._close, _weight)
 
     def wma(self) -> pd.Series:
         """Weighted Moving Average (WMA)
@@ -650,9 +651,6 @@ class CCIIndicator(IndicatorMixin):
         self._run()
 
     def _run(self):
-        def _mad(x):
-            return np.mean(np.abs(x - np.mean(x)))
-
         min_periods = 0 if self._fillna else self._window
         typical_price = (self._high + self._low + self._close) / 3.0
         self._cci = (
@@ -660,9 +658,7 @@ class CCIIndicator(IndicatorMixin):
             - typical_price.rolling(self._window, min_periods=min_periods).mean()
         ) / (
             self._constant
-            * typical_price.rolling(self._window, min_periods=min_periods).apply(
-                _mad, True
-            )
+            * _rolling_mad(typical_price, self._window, min_periods)
         )
 
     def cci(self) -> pd.Series:
@@ -726,47 +722,40 @@ class ADXIndicator(IndicatorMixin):
 
         diff_directional_movement = pdm - pdn
 
-        self._trs_initial = np.zeros(self._window - 1)
-        self._trs = np.zeros(len(self._close) - (self._window - 1))
-        self._trs[0] = diff_directional_movement.dropna().iloc[0 : self._window].sum()
-        diff_directional_movement = diff_directional_movement.reset_index(drop=True)
-
-        for i in range(1, len(self._trs) - 1):
-            self._trs[i] = (
-                self._trs[i - 1]
-                - (self._trs[i - 1] / float(self._window))
-                + diff_directional_movement[self._window + i]
-            )
-
         diff_up = self._high - self._high.shift(1)
         diff_down = self._low.shift(1) - self._low
 
         pos = abs(((diff_up > diff_down) & (diff_up > 0)) * diff_up)
         neg = abs(((diff_down > diff_up) & (diff_down > 0)) * diff_down)
 
-        self._dip = np.zeros(len(self._close) - (self._window - 1))
-        self._dip[0] = pos.dropna().iloc[0 : self._window].sum()
-
-        pos = pos.reset_index(drop=True)
-
-        for i in range(1, len(self._dip) - 1):
-            self._dip[i] = (
-                self._dip[i - 1]
-                - (self._dip[i - 1] / float(self._window))
-                + pos[self._window + i]
-            )
-
-        self._din = np.zeros(len(self._close) - (self._window - 1))
-        self._din[0] = neg.dropna().iloc[0 : self._window].sum()
+        self._trs_initial = np.zeros(self._window - 1)
+        self._trs = self._wilder_sum(diff_directional_movement)
+        self._dip = self._wilder_sum(pos)
+        self._din = self._wilder_sum(neg)
 
-        neg = neg.reset_index(drop=True)
+    def _wilder_sum(self, series: pd.Series) -> np.ndarray:
+        """Wilder's running sum, seeded with the first `window` valid values.
 
-        for i in range(1, len(self._din) - 1):
-            self._din[i] = (
-                self._din[i - 1]
-                - (self._din[i - 1] / float(self._window))
-                + neg[self._window + i]
+        The last element is left at 0, as there is no bar left to feed it.
+        """
+        values = series.to_numpy(dtype="float64")
+        output = np.zeros(len(values) - (self._window - 1))
+        initial = series.dropna().iloc[0 : self._window].sum()
+        output[:-1] = (
+            _wilder_smoothing(
+                values[self._window + 1 :], self._window, initial / self._window
             )
+            * self._window
+        )
+        return output
+
+    def _directional_indicator(self, directional_movement: np.ndarray) -> np.ndarray:
+        return 100 * np.divide(
+            directional_movement,
+            self._trs,
+            out=np.zeros(len(self._trs)),
+            where=self._trs != 0,
+        )
 
     def adx(self) -> pd.Series:
         """Average Directional Index (ADX)
@@ -774,42 +763,27 @@ class ADXIndicator(IndicatorMixin):
         Returns:
             pandas.Series: New feature generated.tr
         """
-        dip = np.zeros(len(self._trs))
-
-        for idx, value in enumerate(self._trs):
-            if value != 0:
-                dip[idx] = 100 * (self._dip[idx] / value)
-
-            else:
-                dip[idx] = 0
-
-        din = np.zeros(len(self._trs))
-
-        for idx, value in enumerate(self._trs):
-            if value != 0:
-                din[idx] = 100 * (self._din[idx] / value)
-
-            else:
-                din[idx] = 0
-
-        directional_index = np.zeros(len(self._trs))
-
-        for idx in range(len(self._trs)):
-            if dip[idx] + din[idx] != 0:
-                directional_index[idx] = 100 * np.abs(
-                    (dip[idx] - din[idx]) / (dip[idx] + din[idx])
-                )
-
-            else:
-                directional_index[idx] = 0
+        dip = self._directional_indicator(self._dip)
+        din = self._directional_indicator(self._din)
+
+        dip_din_sum = dip + din
+        directional_index = 100 * np.abs(
+            np.divide(
+                dip - din,
+                dip_din_sum,
+                out=np.zeros(len(self._trs)),
+                where=dip_din_sum != 0,
+            )
+        )
 
         adx_series = np.zeros(len(self._trs))
-        adx_series[self._window] = directional_index[0 : self._window].mean()
-
-        for i in range(self._window + 1, len(adx_series)):
-            adx_series[i] = (
-                (adx_series[i - 1] * (self._window - 1)) + directional_index[i - 1]
-            ) / float(self._window)
+        # Too few bars to seed the average leaves the ADX at 0
+        if len(self._trs) > self._window:
+            adx_series[self._window :] = _wilder_smoothing(
+                directional_index[self._window : -1],
+                self._window,
+                directional_index[0 : self._window].mean(),
+            )
 
         adx_series = np.concatenate((self._trs_initial, adx_series), axis=0)
         adx_series = pd.Series(data=adx_series, index=self._close.index)
@@ -824,13 +798,7 @@ class ADXIndicator(IndicatorMixin):
             pandas.Series: New feature generated.
         """
         dip = np.zeros(len(self._close))
-
-        for i in range(1, len(self._trs) - 1):
-            if self._trs[i] != 0:
-                dip[i + self._window] = 100 * (self._dip[i] / self._trs[i])
-
-            else:
-                dip[i + self._window] = 0
+        dip[self._window + 1 :] = self._directional_indicator(self._dip)[1:-1]
 
         adx_pos_series = self._check_fillna(
             pd.Series(dip, index=self._close.index), value=20
@@ -845,13 +813,7 @@ class ADXIndicator(IndicatorMixin):
             pandas.Series: New feature generated.
         """
         din = np.zeros(len(self._close))
-
-        for i in range(1, len(self._trs) - 1):
-            if self._trs[i] != 0:
-                din[i + self._window] = 100 * (self._din[i] / self._trs[i])
-
-            else:
-                din[i + self._window] = 0
+        din[self._window + 1 :] = self._directional_indicator(self._din)[1:-1]
 
         adx_neg_series = self._check_fillna(
             pd.Series(din, index=self._close.index), value=20
@@ -931,6 +893,75 @@ class VortexIndicator(IndicatorMixin):
         return pd.Series(vid, name="vid")
 
 
+@_jit
+def _parabolic_sar(high, low, close, step, max_step):  # noqa
+    """Parabolic SAR state machine over float64 arrays.
+
+    Returns the psar, psar up and psar down arrays.
+    """
+    psar = close.copy()
+    psar_up = np.full(len(close), np.nan)
+    psar_down = np.full(len(close), np.nan)
+
+    up_trend = True
+    acceleration_factor = step
+    up_trend_high = high[0]
+    down_trend_low = low[0]
+    prev_psar = psar[1] if len(close) > 1 else np.nan
+
+    for i in range(2, len(close)):
+        reversal = False
+
+        max_high = high[i]
+        min_low = low[i]
+
+        if up_trend:
+            current = prev_psar + acceleration_factor * (up_trend_high - prev_psar)
+
+            if min_low < current:
+                reversal = True
+                current = up_trend_high
+                down_trend_low = min_low
+                acceleration_factor = step
+            else:
+                if max_high > up_trend_high:
+                    up_trend_high = max_high
+                    acceleration_factor = min(acceleration_factor + step, max_step)
+
+                if low[i - 2] < current:
+                    current = low[i - 2]
+                elif low[i - 1] < current:
+                    current = low[i - 1]
+        else:
+            current = prev_psar - acceleration_factor * (prev_psar - down_trend_low)
+
+            if max_high > current:
+                reversal = True
+                current = down_trend_low
+                up_trend_high = max_high
+                acceleration_factor = step
+            else:
+                if min_low < down_trend_low:
+                    down_trend_low = min_low
+                    acceleration_factor = min(acceleration_factor + step, max_step)
+
+                if high[i - 2] > current:
+                    current = high[i - 2]
+                elif high[i - 1] > current:
+                    current = high[i - 1]
+
+        up_trend = up_trend != reversal  # XOR
+
+        psar[i] = current
+        if up_trend:
+            psar_up[i] = current
+        else:
+            psar_down[i] = current
+        prev_psar = current
+
+    return psar, psar_up, psar_down
+
+
 class PSARIndicator(IndicatorMixin):
     """Parabolic Stop and Reverse (Parabolic SAR)
 
@@ -968,75 +999,17 @@ class PSARIndicator(IndicatorMixin):
         self._fillna = fillna
         self._run()
 
-    def _run(self):  # noqa
-        up_trend = True
-        acceleration_factor = self._step
-        up_trend_high = self._high.iloc[0]
-        down_trend_low = self._low.iloc[0]
-
-        self._psar = self._close.copy()
-        self._psar_up = pd.Series(index=self._psar.index, dtype="float64")
-        self._psar_down = pd.Series(index=self._psar.index, dtype="float64")
-
-        for i in range(2, len(self._close)):
-            reversal = False
-
-            max_high = self._high.iloc[i]
-            min_low = self._low.iloc[i]
-
-            if up_trend:
-                self._psar.iloc[i] = self._psar.iloc[i - 1] + (
-                    acceleration_factor * (up_trend_high - self._psar.iloc[i - 1])
-                )
-
-                if min_low < self._psar.iloc[i]:
-                    reversal = True
-                    self._psar.iloc[i] = up_trend_high
-                    down_trend_low = min_low
-                    acceleration_factor = self._step
-                else:
-                    if max_high > up_trend_high:
-                        up_trend_high = max_high
-                        acceleration_factor = min(
-                            acceleration_factor + self._step, self._max_step
-                        )
-
-                    low1 = self._low.iloc[i - 1]
-                    low2 = self._low.iloc[i - 2]
-                    if low2 < self._psar.iloc[i]:
-                        self._psar.iloc[i] = low2
-                    elif low1 < self._psar.iloc[i]:
-                        self._psar.iloc[i] = low1
-            else:
-                self._psar.iloc[i] = self._psar.iloc[i - 1] - (
-                    acceleration_factor * (self._psar.iloc[i - 1] - down_trend_low)
-                )
-
-                if max_high > self._psar.iloc[i]:
-                    reversal = True
-                    self._psar.iloc[i] = down_trend_low
-                    up_trend_high = max_high
-                    acceleration_factor = self._step
-                else:
-                    if min_low < down_trend_low:
-                        down_trend_low = min_low
-                        acceleration_factor = min(
-                            acceleration_factor + self._step, self._max_step
-                        )
-
-                    high1 = self._high.iloc[i - 1]
-                    high2 = self._high.iloc[i - 2]
-                    if high2 > self._psar.iloc[i]:
-                        self._psar[i] = high2
-                    elif high1 > self._psar.iloc[i]:
-                        self._psar.iloc[i] = high1
-
-            up_trend = up_trend != reversal  # XOR
-
-            if up_trend:
-                self._psar_up.iloc[i] = self._psar.iloc[i]
-            else:
-                self._psar_down.iloc[i] = self._psar.iloc[i]
+    def _run(self):
+        psar, psar_up, psar_down = _parabolic_sar(
+            self._high.to_numpy(dtype="float64"),
+            self._low.to_numpy(dtype="float64"),
+            self._close.to_numpy(dtype="float64"),
+            float(self._step),
+            float(self._max_step),
+        )
+        self._psar = pd.Series(psar, index=self._close.index)
+        self._psar_up = pd.Series(psar_up, index=self._close.index)
+        self._psar_down = pd.Series(psar_down, index=self._close.index)
 
     def psar(self) -> pd.Series:
         """PSAR value
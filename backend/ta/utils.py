@@ -5,10 +5,16 @@
 .. moduleauthor:: Dario Lopez Padial (Bukosabino)
 
 """
+import functools
+import importlib.util
 import math
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# numba is an optional accelerator
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
 
 
 class IndicatorMixin:
@@ -46,6 +52,28 @@ class IndicatorMixin:
         return true_range
 
 
+def _jit(function):
+    """Compile ``function`` with numba when it is installed, else return it as is.
+
+    Importing numba takes longer than importing pandas, so compilation is
+    deferred to the first call instead of happening when ta is imported.
+    """
+    if not _HAS_NUMBA:
+        return function
+    compiled = None
+
+    @functools.wraps(function)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            from numba import njit
+
+            compiled = njit(cache=True)(function)
+        return compiled(*args)
+
+    return wrapper
+
+
 def dropna(df: pd.DataFrame) -> pd.DataFrame:
     """Drop rows with "Nans" values"""
     df = df.copy()
@@ -66,6 +94,57 @@ def _ema(series, periods: int, fillna: bool = False):
     return series.ewm(span=periods, min_periods=min_periods, adjust=False).mean()
 
 
+@_jit
+def _linear_filter_loop(decay, impulse, initial):
+    output = np.empty(len(impulse))
+    previous = initial
+    for i in range(len(impulse)):
+        previous = decay[i] * previous + impulse[i]
+        output[i] = previous
+    return output
+
+
+def _linear_filter_scan(decay, impulse, initial):
+    # Each step is the affine map y -> decay * y + impulse. Composing every map
+    # with the one `shift` steps earlier, for shift = 1, 2, 4, ..., leaves the
+    # composition of all maps up to each step after log2(n) array passes.
+    impulse[:1] += decay[:1] * initial
+    shift = 1
+    while shift < len(impulse):
+        impulse[shift:] = decay[shift:] * impulse[:-shift] + impulse[shift:]
+        decay[shift:] = decay[shift:] * decay[:-shift]
+        shift *= 2
+    return impulse
+
+
+def _linear_filter(decay, impulse, initial: float) -> np.ndarray:
+    """First-order recursive filter ``y[i] = decay[i] * y[i-1] + impulse[i]``.
+
+    ``y[-1]`` is ``initial`` and ``decay`` may be a scalar. The recursion is a
+    compiled loop when numba is installed, and a log-depth prefix scan over
+    NumPy arrays otherwise, so it never runs a Python loop per element.
+    """
+    impulse = np.array(impulse, dtype="float64")
+    decay = np.broadcast_to(np.asarray(decay, dtype="float64"), impulse.shape).copy()
+    if not _HAS_NUMBA:
+        return _linear_filter_scan(decay, impulse, float(initial))
+    return _linear_filter_loop(decay, impulse, float(initial))
+
+
+def _wilder_smoothing(values: np.ndarray, window: int, initial: float) -> np.ndarray:
+    """Wilder's smoothing over a plain array.
+
+    Computes ``y[0] = initial`` and ``y[i] = y[i-1] + (values[i-1] - y[i-1]) / window``,
+    so the output is one element longer than ``values``.
+    """
+    output = np.empty(len(values) + 1, dtype="float64")
+    output[0] = initial
+    output[1:] = _linear_filter(
+        1.0 - 1.0 / window, np.asarray(values, dtype="float64") / window, initial
+    )
+    return output
+
+
 def _get_min_max(series1: pd.Series, series2: pd.Series, function: str = "min"):
     """Find min or max value between two lists for each index"""
     series1 = np.array(series1)
@@ -80,6 +159,85 @@ def _get_min_max(series1: pd.Series, series2: pd.Series, function: str = "min"):
     return pd.Series(output)
 
 
+def _rolling_arg_extreme(
+    series: pd.Series, window: int, min_periods: int, function: str = "max"
+) -> pd.Series:
+    """Position of the max or min value inside each rolling window.
+
+    Equivalent to ``series.rolling(window, min_periods).apply(np.argmax, raw=True)``
+    (or ``np.argmin``), including numpy's tie-breaking on the first occurrence,
+    but evaluated over a sliding window view with no Python call per window.
+    """
+    if function == "max":
+        arg_function, padding = np.argmax, -np.inf
+    elif function == "min":
+        arg_function, padding = np.argmin, np.inf
+    else:
+        raise ValueError('"function" variable value should be "min" or "max"')
+
+    values = series.to_numpy(dtype="float64")
+    if len(values) == 0:
+        return pd.Series(values, index=series.index)
+
+    # Pad the front so the first, partial windows are full-length too, then
+    # shift their positions back so they count from the first real value.
+    padded = np.concatenate((np.full(window - 1, padding), values))
+    positions = arg_function(sliding_window_view(padded, window), axis=1)
+    positions = positions.astype("float64")
+    positions[: window - 1] -= np.arange(window - 1, 0, -1)[: len(values)]
+
+    observations = series.notna().rolling(window, min_periods=0).sum()
+    positions[observations.to_numpy() < max(min_periods, 1)] = np.nan
+    return pd.Series(positions, index=series.index)
+
+
+def _rolling_weighted_sum(series: pd.Series, weights: np.ndarray) -> pd.Series:
+    """Weighted sum over each full rolling window, oldest value first.
+
+    Evaluated as a single convolution; windows holding a NaN give NaN, as
+    ``rolling(len(weights)).apply`` does.
+    """
+    window = len(weights)
+    values = series.to_numpy(dtype="float64")
+    output = np.full(len(values), np.nan)
+    if len(values) >= window:
+        output[window - 1 :] = np.convolve(values, weights[::-1], mode="valid")
+    return pd.Series(output, index=series.index)
+
+
+def _rolling_mad(series: pd.Series, window: int, min_periods: int) -> pd.Series:
+    """Mean absolute deviation around the mean of each rolling window.
+
+    Full windows are reduced one window offset at a time, so memory stays
+    O(n) and no Python call is made per window; the few leading partial
+    windows allowed by ``min_periods`` are computed directly.
+    """
+    values = series.to_numpy(dtype="float64")
+    output = np.full(len(values), np.nan)
+
+    for i in range(max(min_periods, 1) - 1, min(window - 1, len(values))):
+        head = values[: i + 1]
+        output[i] = np.mean(np.abs(head - np.mean(head)))
+
+    if len(values) >= window:
+        windows = sliding_window_view(values, window)
+        mean = windows.mean(axis=1)
+        deviation = np.zeros(len(mean))
+        for offset in range(window):
+            deviation += np.abs(windows[:, offset] - mean)
+        output[window - 1 :] = deviation / window
+
+    return pd.Series(output, index=series.index)
+
+
+def _rolling_sum_of_squares(series: pd.Series, window: int) -> pd.Series:
+    """Sum of squared values over each full rolling window."""
+    sum_of_squares = (series**2).rolling(window).sum()
+    # The running sum can leave a tiny negative residue where the exact
+    # result is zero; clip it so callers can take a square root safely.
+    return sum_of_squares.clip(lower=0.0)
+
+
 def crossed_above(series1: pd.Series, series2: pd.Series) -> pd.Series:
     """Check if series1 crossed above series2"""
     return (series1 > series2) & (series1.shift(1) <= series2.shift(1))
@@ -8,7 +8,7 @@
 import numpy as np
 import pandas as pd
 
-from ta.utils import IndicatorMixin
+from ta.utils import IndicatorMixin, _rolling_sum_of_squares, _wilder_smoothing
 
 
 class AverageTrueRange(IndicatorMixin):
@@ -47,11 +47,11 @@ class AverageTrueRange(IndicatorMixin):
         close_shift = self._close.shift(1)
         true_range = self._true_range(self._high, self._low, close_shift)
         atr = np.zeros(len(self._close))
-        atr[self._window - 1] = true_range[0 : self._window].mean()
-        for i in range(self._window, len(atr)):
-            atr[i] = (atr[i - 1] * (self._window - 1) + true_range.iloc[i]) / float(
-                self._window
-            )
+        atr[self._window - 1 :] = _wilder_smoothing(
+            true_range.to_numpy()[self._window :],
+            self._window,
+            true_range.iloc[0 : self._window].mean(),
+        )
         self._atr = pd.Series(data=atr, index=true_range.index)
 
     def average_true_range(self) -> pd.Series:
@@ -450,14 +450,9 @@ class UlcerIndex(IndicatorMixin):
     def _run(self):
         _ui_max = self._close.rolling(self._window, min_periods=1).max()
         _r_i = 100 * (self._close - _ui_max) / _ui_max
-
-        def ui_function():
-            def _ui_function(x):
-                return np.sqrt((x**2 / self._window).sum())
-
-            return _ui_function
-
-        self._ulcer_idx = _r_i.rolling(self._window).apply(ui_function(), raw=True)
+        self._ulcer_idx = np.sqrt(
+            _rolling_sum_of_squares(_r_i, self._window) / self._window
+        )
 
     def ulcer_index(self) -> pd.Series:
         """Ulcer Index (UI)
@@ -326,15 +326,13 @@ class NegativeVolumeIndexIndicator(IndicatorMixin):
     def _run(self):
         price_change = self._close.pct_change()
         vol_decrease = self._volume.shift(1) > self._volume
+        # NVI only moves on bars where volume decreased, so it is the running
+        # product of those bars' (1 + price change), starting from 1000.
+        factor = np.where(vol_decrease, 1.0 + price_change, 1.0)
+        factor[:1] = 1000
         self._nvi = pd.Series(
-            data=np.nan, index=self._close.index, dtype="float64", name="nvi"
+            data=np.cumprod(factor), index=self._close.index, name="nvi"
         )
-        self._nvi.iloc[0] = 1000
-        for i in range(1, len(self._nvi)):
-            if vol_decrease.iloc[i]:
-                self._nvi.iloc[i] = self._nvi.iloc[i - 1] * (1.0 + price_change.iloc[i])
-            else:
-                self._nvi.iloc[i] = self._nvi.iloc[i - 1]
 
     def negative_volume_index(self) -> pd.Series:
         """Negative Volume Index (NVI)
@@ -395,18 +393,13 @@ class MFIIndicator(IndicatorMixin):
 
         # Positive and negative money flow with n periods
         min_periods = 0 if self._fillna else self._window
-        n_positive_mf = mfr.rolling(self._window, min_periods=min_periods).apply(
-            lambda x: np.sum(np.where(x >= 0.0, x, 0.0)), raw=True
+        n_positive_mf = (
+            mfr.clip(lower=0.0).rolling(self._window, min_periods=min_periods).sum()
         )
         n_negative_mf = abs(
-            mfr.rolling(self._window, min_periods=min_periods).apply(
-                lambda x: np.sum(np.where(x < 0.0, x, 0.0)), raw=True
-            )
+            mfr.clip(upper=0.0).rolling(self._window, min_periods=min_periods).sum()
         )
 
-        # n_positive_mf = np.where(mf.rolling(self._window).sum() >= 0.0, mf, 0.0)
-        # n_negative_mf = abs(np.where(mf.rolling(self._window).sum() < 0.0, mf, 0.0))
-
         # Money flow index
         mfi = n_positive_mf / n_negative_mf
         self._mfi = 100 - (100 / (1 + mfi))
@@ -129,21 +129,20 @@ def add_volume_ta(
         fillna=fillna,
     ).volume_weighted_average_price()
 
-    if not vectorized:
-        # Money Flow Indicator
-        df[f"{colprefix}volume_mfi"] = MFIIndicator(
-            high=df[high],
-            low=df[low],
-            close=df[close],
-            volume=df[volume],
-            window=14,
-            fillna=fillna,
-        ).money_flow_index()
+    # Money Flow Indicator
+    df[f"{colprefix}volume_mfi"] = MFIIndicator(
+        high=df[high],
+        low=df[low],
+        close=df[close],
+        volume=df[volume],
+        window=14,
+        fillna=fillna,
+    ).money_flow_index()
 
-        # Negative Volume Index
-        df[f"{colprefix}volume_nvi"] = NegativeVolumeIndexIndicator(
-            close=df[close], volume=df[volume], fillna=fillna
-        ).negative_volume_index()
+    # Negative Volume Index
+    df[f"{colprefix}volume_nvi"] = NegativeVolumeIndexIndicator(
+        close=df[close], volume=df[volume], fillna=fillna
+    ).negative_volume_index()
 
     return df
 
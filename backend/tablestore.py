@@ -0,0 +1,104 @@
+import importlib.util
+import logging
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+# pyarrow is optional; without it tables are kept as CSV. pandas imports it
+# when a columnar file is first read or written.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {"parquet": "parquet", "feather": "feather", "csv": "csv"}
+
+
+class TableStore:
+    """
+    Named DataFrame tables on disk, as Parquet, Feather or CSV files.
+
+    The columnar formats need pyarrow; they store typed columns, so reading
+    needs no parsing and can load just the requested columns. Without pyarrow,
+    or for a frame pyarrow cannot encode, the table is written as CSV instead.
+    """
+
+    def __init__(self, root: str, format: str = "parquet"):
+        if format not in _EXTENSIONS:
+            raise ValueError(
+                f"Unknown storage format: {format}. Choose from {list(_EXTENSIONS)}"
+            )
+        self.root = root
+        self.format = format
+        if format != "csv" and not _HAS_PYARROW:
+            logger.warning("pyarrow is not installed; storing %s tables as CSV", format)
+            self.format = "csv"
+
+    def _path(self, name: str, format: str) -> str:
+        return os.path.join(self.root, f"{name}.{_EXTENSIONS[format]}")
+
+    def path(self, name: str) -> str:
+        """
+        File a table is read from.
+
+        This is the file in the configured format, or the CSV file if the
+        table was never written in that format.
+        """
+        path = self._path(name, self.format)
+        if self.format != "csv" and not os.path.exists(path):
+            return self._path(name, "csv")
+        return path
+
+    def read(self, name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load a table, or only `columns` of it.
+
+        Raises FileNotFoundError if there is no table.
+        """
+        path = self.path(name)
+        if path.endswith(".parquet"):
+            return pd.read_parquet(path, columns=columns)
+        if path.endswith(".feather"):
+            return pd.read_feather(path, columns=columns)
+        return pd.read_csv(path, usecols=columns)
+
+    def write(self, name: str, frame: pd.DataFrame):
+        """
+        Replace a table, atomically.
+
+        A named index is stored as a column, like to_csv does; a default
+        RangeIndex is dropped.
+        """
+        if self.format != "csv":
+            try:
+                self._write(name, frame, self.format)
+                return
+            except (ValueError, TypeError) as error:
+                # pyarrow rejects object columns that mix types; CSV does not
+                logger.warning(
+                    "Writing table %s as CSV, %s failed: %s", name, self.format, error
+                )
+        self._write(name, frame, "csv")
+
+    def _write(self, name: str, frame: pd.DataFrame, format: str):
+        path = self._path(name, format)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if format == "csv":
+                frame.to_csv(tmp_path)
+            else:
+                table = frame.reset_index(drop=frame.index.name is None)
+                if format == "parquet":
+                    table.to_parquet(tmp_path, index=False)
+                else:
+                    table.to_feather(tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        # Drop the copy in the other format so reads never see a stale table
+        for other in {"csv", self.format} - {format}:
+            if os.path.exists(self._path(name, other)):
+                os.remove(self._path(name, other))
@@ -1,10 +1,13 @@
 # @title Hàm lấy dữ liệu bộ lọc (legacy)
+import numpy as np
 import pandas as pd
+import asyncio
 import json
-import requests
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
+import http_session
+
 
 _BASE_URL = "https://apipubaws.tcbs.com.vn"
 _STOCKS_URL = "stock-insight"
@@ -39,6 +42,19 @@ _OHLC_DTYPE = {
     "close": "float64",
     "volume": "int64",
 }
+# Opt-in compact schema for keeping long histories in memory: float32 prices,
+# uint32 volume and categorical metadata, roughly a third of the default size
+_COMPACT_DTYPE = {
+    "time": "datetime64[ns]",
+    "open": "float32",
+    "high": "float32",
+    "low": "float32",
+    "close": "float32",
+    "volume": "uint32",
+    "name": "category",
+    "category": "category",
+    "source": "category",
+}
 
 tcbs_headers = {
     "sec-ch-ua": '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"',
@@ -95,12 +111,14 @@ def stock_screening_insights(
         payload["size"] = size
 
     # send request to get response
-    response = requests.request(
-        "POST",
-        url,
-        headers=headers,
-        data=json.dumps(payload),
-    ).json()
+    response = http_session.parse_json(
+        http_session.post(
+            url,
+            headers=headers,
+            data=json.dumps(payload),
+            idempotent=True,
+        )
+    )
 
     df = pd.json_normalize(response["searchData"]["pageContent"])
 
@@ -120,6 +138,7 @@ def history(
     interval: Optional[str] = "1D",
     count_back: Optional[int] = 365,
     show_log: bool = False,
+    compact: bool = False,
 ) -> Dict:
     """
     Tham số:
@@ -127,6 +146,7 @@ def history(
         - interval (tùy chọn): Khung thời gian trích xuất dữ liệu giá lịch sử (1m, 5m, 15m, 30m, 1H, 1D, 1W, 1M).
         - show_log (tùy chọn): Hiển thị thông tin log giúp debug dễ dàng.
         - count_back (tùy chọn): Số lượng dữ liệu trả về từ thời điểm cuối. Mặc định là 365.
+        - compact (tùy chọn): Nếu True, trả về giá float32, khối lượng uint32 và metadata dạng category để tiết kiệm bộ nhớ.
     """
     # Validate inputs
     if interval not in _INTERVAL_MAP:
@@ -158,14 +178,14 @@ def history(
         print(f"Tải dữ liệu từ {url}")
 
     # Send a GET request to fetch the data
-    response = requests.get(url, headers=tcbs_headers)
+    response = http_session.get(url, headers=tcbs_headers)
 
     if response.status_code != 200:
         raise ConnectionError(
             f"Tải dữ liệu không thành công: {response.status_code} - {response.reason}"
         )
 
-    json_data = response.json()
+    json_data = http_session.parse_json(response)
 
     if show_log:
         print(
@@ -182,67 +202,155 @@ def history(
             symbol=symbol,
             asset_type=asset_type,
             interval=interval,
+            compact=compact,
         )
         return df
 
 
+async def history_many_async(
+    symbols: List[str],
+    asset_type: str,
+    end: Optional[str] = None,
+    interval: Optional[str] = "1D",
+    count_back: Optional[int] = 365,
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    raise_errors: bool = True,
+    concat: bool = False,
+    compact: bool = False,
+):
+    """
+    Coroutine version of history_many(), with the same parameters.
+
+    Await it from code already running an event loop (async code,
+    Jupyter/Colab), where history_many() cannot start its own.
+    """
+    calls = {
+        symbol: {
+            "symbol": symbol,
+            "asset_type": asset_type,
+            "end": end,
+            "interval": interval,
+            "count_back": count_back,
+            "compact": compact,
+        }
+        for symbol in symbols
+    }
+    frames = await http_session.gather_limited(
+        history, calls, concurrency, rate_limit, raise_errors
+    )
+    if concat:
+        df = pd.concat(frames.values(), ignore_index=True)
+        if compact:
+            # Categoricals with different categories concatenate as object
+            df = df.astype({col: "category" for col in ["name", "category", "source"]})
+        return df
+    return frames
+
+
+def history_many(
+    symbols: List[str],
+    asset_type: str,
+    end: Optional[str] = None,
+    interval: Optional[str] = "1D",
+    count_back: Optional[int] = 365,
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    raise_errors: bool = True,
+    concat: bool = False,
+    compact: bool = False,
+):
+    """
+    Fetch history for many symbols concurrently.
+
+    This starts its own event loop; inside a running one, await
+    history_many_async() instead.
+
+    Parameters:
+        symbols (list): ticker symbols; the other history parameters apply to all.
+        concurrency (int): maximum number of requests in flight.
+        rate_limit (float): maximum number of requests started per second.
+        raise_errors (bool): if False, symbols that fail are left out.
+        concat (bool): if True, return one long-format DataFrame
+            (one row per symbol and bar, identified by the `name` column)
+            instead of a dict of symbol -> DataFrame.
+        compact (bool): if True, return the compact float32/uint32/categorical schema.
+    """
+    http_session.require_no_running_loop("history_many()", "history_many_async()")
+    return asyncio.run(
+        history_many_async(
+            symbols=symbols,
+            asset_type=asset_type,
+            end=end,
+            interval=interval,
+            count_back=count_back,
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+            raise_errors=raise_errors,
+            concat=concat,
+            compact=compact,
+        )
+    )
+
+
 def _as_df(
     history_data: Dict,
     symbol: str,
     asset_type: str,
     interval: str,
     floating: Optional[int] = 2,
+    compact: bool = False,
 ) -> pd.DataFrame:
     if not history_data:
         raise ValueError("Input data is empty or not provided.")
 
-    # TCBS data is already a list of dictionaries
-    df = pd.DataFrame(history_data)
-    # Apply column mapping directly through rename
-    df.rename(columns=_OHLC_MAP, inplace=True)
-
-    # Ensure all required columns exist
-    required_columns = ["time", "open", "high", "low", "close", "volume"]
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    # TCBS data is a list of dictionaries; pull each required column out as a
+    # typed array in one pass instead of building a row-wise frame first.
+    available = history_data[0].keys()
+    missing_columns = [key for key in _OHLC_MAP if key not in available]
     if missing_columns:
         raise ValueError(
-            f"Missing required columns: {missing_columns}. Available columns: {df.columns.tolist()}"
+            f"Missing required columns: {[_OHLC_MAP[key] for key in missing_columns]}. Available columns: {list(available)}"  # noqa
         )
 
-    # Standard column order
-    df = df[["time", "open", "high", "low", "close", "volume"]]
+    def _column(key):
+        return [row.get(key) for row in history_data]
 
     # Time conversion - handle different formats based on source
-    if "time" in df.columns:
-        df["time"] = pd.to_datetime(df["time"], errors="coerce")
+    time = pd.to_datetime(_column("tradingDate"), errors="coerce")
+    if time.tz is not None:
+        time = time.tz_localize(None)  # Remove timezone info
+        if interval == "1D":
+            time = time.normalize()
+    columns = {"time": time.astype(_OHLC_DTYPE["time"])}
 
-    # Price scaling for non-index/derivative assets
-    if asset_type not in ["index", "derivative"]:
-        df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].div(
-            1000
-        )
+    for key in ["open", "high", "low", "close"]:
+        prices = np.array(_column(key), dtype="float64")
+        # Price scaling for non-index/derivative assets
+        if asset_type not in ["index", "derivative"]:
+            prices /= 1000
+        # Round price columns
+        columns[key] = np.round(prices, floating, out=prices)
 
-    # Round price columns
-    df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].round(
-        floating
-    )
+    columns["volume"] = np.array(_column("volume"), dtype=_OHLC_DTYPE["volume"])
 
-    # Apply data types
-    for col, dtype in _OHLC_DTYPE.items():
-        if col in df.columns:
-            if (
-                dtype == "datetime64[ns]"
-                and hasattr(df[col], "dt")
-                and df[col].dt.tz is not None
-            ):
-                df[col] = df[col].dt.tz_localize(None)  # Remove timezone info
-                if interval == "1D":
-                    df[col] = df[col].dt.date
-            df[col] = df[col].astype(dtype)
+    df = pd.DataFrame(columns, copy=False)
 
     # Add metadata
     df["name"] = symbol
     df["category"] = asset_type
     df["source"] = "TCBS"
 
+    if compact:
+        df = _compact(df)
+
     return df
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast a history frame to the compact schema."""
+    dtype = dict(_COMPACT_DTYPE)
+    if len(df) and df["volume"].max() > np.iinfo("uint32").max:
+        # Summed volume of weekly/monthly index bars can overflow uint32
+        dtype["volume"] = _OHLC_DTYPE["volume"]
+    return df.astype(dtype)
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+
+from const import SL_RATIO, TP_RATIO
+
+EXIT_STOP_LOSS = "stop_loss"
+EXIT_TAKE_PROFIT = "take_profit"
+EXIT_SELL = "sell"
+EXIT_OPEN = "open"
+
+# Bars scanned per step of the first-touch search
+_HORIZON = 256
+
+
+def _next_sell(sell):
+    """Index of the first sell bar strictly after each bar, len(sell) if none."""
+    n = len(sell)
+    sell_index = np.where(sell, np.arange(n), n)
+    following = np.full(n, n)
+    following[:-1] = np.minimum.accumulate(sell_index[::-1])[::-1][1:]
+    return following
+
+
+def _first_touch(high, low, entries, stop_loss, take_profit, limit):
+    """First bar after each entry whose range reaches its stop or target.
+
+    The search looks at `_HORIZON` bars after every pending entry at once and
+    moves on only for entries not resolved yet, so it loops over blocks of
+    bars rather than single bars. A bar reaching both levels counts as a stop,
+    since the order of touches inside a bar is unknown.
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): touch bar, or -1 if the level was
+        not reached by `limit`, and whether that touch is a stop.
+    """
+    touch = np.full(len(entries), -1)
+    is_stop = np.zeros(len(entries), dtype=bool)
+    pending = np.arange(len(entries))
+    offset = 1
+    while pending.size:
+        bars = entries[pending, None] + offset + np.arange(_HORIZON)
+        in_range = bars <= limit[pending, None]
+        clipped = np.minimum(bars, len(high) - 1)
+        stop_hit = in_range & (low[clipped] <= stop_loss[pending, None])
+        target_hit = in_range & (high[clipped] >= take_profit[pending, None])
+        hit = stop_hit | target_hit
+
+        found = hit.any(axis=1)
+        first = hit.argmax(axis=1)[found]
+        resolved = pending[found]
+        touch[resolved] = bars[found, first]
+        is_stop[resolved] = stop_hit[found, first]
+
+        pending = pending[~found & (bars[:, -1] < limit[pending])]
+        offset += _HORIZON
+    return touch, is_stop
+
+
+def trade_list(data, sl_ratio=SL_RATIO, tp_ratio=TP_RATIO):
+    """Trades from the Buy/Sell signals of data_builder, with stop-loss and take-profit.
+
+    A trade opens at the close of a Buy bar, with its stop `sl_ratio` below
+    and its target `tp_ratio` above that close. It exits at the first later
+    bar whose low reaches the stop or whose high reaches the target, filled
+    at that level or at the bar's open if it gapped through. Otherwise it
+    exits at the close of the next Sell bar, or stays open at the last close.
+    One trade is held at a time; Buy signals during a trade are ignored.
+
+    Args:
+        data(pandas.DataFrame): open, high, low, close, Buy and Sell columns,
+            indexed by time or with a `time` column.
+        sl_ratio(float): stop-loss distance as a fraction of the entry price.
+        tp_ratio(float): take-profit distance as a fraction of the entry price.
+
+    Returns:
+        pandas.DataFrame: one row per trade with entry/exit time and price,
+        exit_reason, bars_held and return.
+    """
+    times = data["time"] if "time" in data.columns else data.index.to_series()
+    times = times.to_numpy()
+    open_, high, low, close = (
+        data[column].to_numpy(dtype="float64")
+        for column in ["open", "high", "low", "close"]
+    )
+    buy = data["Buy"].to_numpy(dtype=bool)
+    sell = data["Sell"].to_numpy(dtype=bool)
+    last = len(close) - 1
+
+    entries = np.flatnonzero(buy)
+    entry_price = close[entries]
+    stop_loss = entry_price * (1 - sl_ratio)
+    take_profit = entry_price * (1 + tp_ratio)
+
+    # Without a stop or target touch, a trade ends at the next sell bar
+    next_sell = _next_sell(sell)[entries]
+    exits = np.minimum(next_sell, last)
+    reasons = np.where(next_sell <= last, EXIT_SELL, EXIT_OPEN).astype(object)
+    exit_price = close[exits]
+
+    # A level touched during the sell bar is hit before that bar's close
+    touch, is_stop = _first_touch(high, low, entries, stop_loss, take_profit, exits)
+    touched = touch >= 0
+    exits[touched] = touch[touched]
+    stopped = touched & is_stop
+    reasons[stopped] = EXIT_STOP_LOSS
+    exit_price[stopped] = np.minimum(stop_loss, open_[exits])[stopped]
+    targeted = touched & ~is_stop
+    reasons[targeted] = EXIT_TAKE_PROFIT
+    exit_price[targeted] = np.maximum(take_profit, open_[exits])[targeted]
+
+    # Keep only entries taken while flat; one step per trade, not per bar
+    taken = []
+    k = 0
+    while k < len(entries):
+        taken.append(k)
+        k = np.searchsorted(entries, exits[k], side="right")
+
+    entries, exits = entries[taken], exits[taken]
+    return pd.DataFrame(
+        {
+            "entry_time": times[entries],
+            "entry_price": entry_price[taken],
+            "exit_time": times[exits],
+            "exit_price": exit_price[taken],
+            "exit_reason": reasons[taken],
+            "bars_held": exits - entries,
+            "return": exit_price[taken] / entry_price[taken] - 1,
+        }
+    )
+
+
+def trade_summary(trades):
+    """Trade count, win rate, average and compounded return, max drawdown."""
+    returns = trades["return"].to_numpy(dtype="float64")
+    if not len(returns):
+        return {
+            "trades": 0,
+            "win_rate": 0.0,
+            "average_return": 0.0,
+            "total_return": 0.0,
+            "max_drawdown": 0.0,
+        }
+    equity = np.cumprod(1 + returns)
+    peak = np.maximum(np.maximum.accumulate(equity), 1.0)
+    return {
+        "trades": len(returns),
+        "win_rate": float((returns > 0).mean()),
+        "average_return": float(returns.mean()),
+        "total_return": float(equity[-1] - 1),
+        "max_drawdown": float((1 - equity / peak).max()),
+    }
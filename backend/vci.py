@@ -1,12 +1,17 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import json
-import requests
+import asyncio
+
+import http_session
 
 
 _TRADING_URL = "https://trading.vietcap.com.vn/api/"
 _CHART_URL = "chart/OHLCChart/gap"
+# Maximum number of symbols sent in one chart request
+_BATCH_LIMIT = 50
 _INTERVAL_MAP = {
     "1m": "ONE_MINUTE",
     "5m": "ONE_MINUTE",
@@ -41,6 +46,21 @@ _OHLC_DTYPE = {
     "close": "float64",
     "volume": "int64",
 }
+# Opt-in compact schema for keeping long histories in memory: float32 prices,
+# uint32 volume and categorical metadata, roughly a third of the default size
+_COMPACT_DTYPE = {
+    "time": "datetime64[ns]",
+    "open": "float32",
+    "high": "float32",
+    "low": "float32",
+    "close": "float32",
+    "volume": "uint32",
+    "name": "category",
+    "category": "category",
+    "source": "category",
+}
+# Asia/Ho_Chi_Minh offset from UTC, in seconds (no daylight saving)
+_LOCAL_UTC_OFFSET = 7 * 60 * 60
 DEFAULT_HEADERS = {
     "Accept": "application/json, text/plain, */*",
     "Accept-Language": "en-US,en;q=0.9,vi-VN;q=0.8,vi;q=0.7",
@@ -75,6 +95,7 @@ def history(
     end: Optional[str] = None,
     interval: Optional[str] = "1D",
     show_log: Optional[bool] = False,
+    compact: bool = False,
 ):
     """
     Tải lịch sử giá của mã chứng khoán từ nguồn dữ liệu VN Direct.
@@ -89,7 +110,87 @@ def history(
             Giá trị nhận: 1m, 5m, 15m, 30m, 1H, 1D, 1W, 1M. Mặc định là "1D".
         - show_log (tùy chọn): Hiển thị thông tin log giúp debug dễ dàng.
             Mặc định là False.
+        - compact (tùy chọn): Nếu True, trả về giá float32, khối lượng uint32
+            và metadata dạng category để tiết kiệm bộ nhớ. Mặc định là False.
+    """
+    json_data = _fetch_chart([symbol], start, end, interval, show_log)
+
+    # if json_data is empty, raise an error
+    if not json_data:
+        raise ValueError(
+            "Không tìm thấy dữ liệu. Vui lòng kiểm tra lại mã chứng khoán hoặc thời gian truy xuất."
+        )
+    else:
+        df = _as_df(
+            history_data=json_data[0],
+            symbol=symbol,
+            asset_type=asset_type,
+            interval=interval,
+            compact=compact,
+        )
+
+        return df
+
+
+def history_batch(
+    symbols: List[str],
+    asset_type: str,
+    start: str,
+    end: Optional[str] = None,
+    interval: Optional[str] = "1D",
+    chunk_size: int = _BATCH_LIMIT,
+    show_log: Optional[bool] = False,
+    compact: bool = False,
+) -> Dict[str, pd.DataFrame]:
     """
+    Fetch history for many symbols with one chart request per `chunk_size` symbols.
+
+    The chart endpoint takes a list of symbols and answers with one block per
+    symbol, so this sends ceil(len(symbols) / chunk_size) requests in total.
+    The other parameters are the same as for history().
+
+    Returns:
+        - dict of symbol -> DataFrame. Symbols without data are left out.
+    """
+    frames = {}
+    for i in range(0, len(symbols), chunk_size):
+        chunk = symbols[i : i + chunk_size]
+        json_data = _fetch_chart(chunk, start, end, interval, show_log) or []
+        for position, block in enumerate(json_data):
+            # Blocks carry their symbol. The request order is only a safe
+            # fallback when no symbol's block was left out.
+            symbol = block.get("symbol")
+            if not symbol:
+                if len(json_data) != len(chunk):
+                    raise ValueError(
+                        f"Dữ liệu trả về không có mã chứng khoán: {len(json_data)} khối cho {len(chunk)} mã."
+                    )
+                symbol = chunk[position]
+            if not block.get("t"):
+                continue
+            frames[symbol] = _as_df(
+                history_data=block,
+                symbol=symbol,
+                asset_type=asset_type,
+                interval=interval,
+                compact=compact,
+            )
+
+    if not frames:
+        raise ValueError(
+            "Không tìm thấy dữ liệu. Vui lòng kiểm tra lại mã chứng khoán hoặc thời gian truy xuất."
+        )
+    return frames
+
+
+def _fetch_chart(
+    symbols: List[str],
+    start: str,
+    end: Optional[str],
+    interval: str,
+    show_log: Optional[bool] = False,
+) -> List[Dict]:
+    """Post one OHLC chart request for `symbols` and return its JSON blocks."""
     # Validate inputs
     if interval not in _INTERVAL_MAP:
         raise ValueError(
@@ -102,8 +203,8 @@ def history(
     if end is not None:
         end_time = datetime.strptime(end, "%Y-%m-%d") + pd.Timedelta(days=1)
 
-    if start_time > end_time:
-        raise ValueError("Thời gian bắt đầu không thể lớn hơn thời gian kết thúc.")
+        if start_time > end_time:
+            raise ValueError("Thời gian bắt đầu không thể lớn hơn thời gian kết thúc.")
 
     # convert start and end date to timestamp
     if end is None:
@@ -122,7 +223,7 @@ def history(
     payload = json.dumps(
         {
             "timeFrame": intvl,
-            "symbols": [symbol],
+            "symbols": symbols,
             "from": start_stamp,
             "to": end_stamp,
         }
@@ -131,36 +232,109 @@ def history(
     if show_log:
         print(f"Tải dữ liệu từ {url}\npayload: {payload}")
 
-    # Send a GET request to fetch the data
-    response = requests.post(url, headers=headers, data=payload)
+    # Send a POST request to fetch the data
+    response = http_session.post(url, headers=headers, data=payload, idempotent=True)
 
     if response.status_code != 200:
         raise ConnectionError(
             f"Failed to fetch data: {response.status_code} - {response.reason}"
         )
 
-    json_data = response.json()
+    json_data = http_session.parse_json(response)
 
     if show_log:
         print(
-            f"Truy xuất thành công dữ liệu {symbol} từ {start}"
+            f"Truy xuất thành công dữ liệu {', '.join(symbols)} từ {start}"
             f" đến {end}, khung thời gian {interval}."
         )
 
-    # if json_data is empty, raise an error
-    if not json_data:
-        raise ValueError(
-            "Không tìm thấy dữ liệu. Vui lòng kiểm tra lại mã chứng khoán hoặc thời gian truy xuất."
-        )
-    else:
-        df = _as_df(
-            history_data=json_data[0],
-            symbol=symbol,
+    return json_data
+
+
+async def history_many_async(
+    symbols: List[str],
+    asset_type: str,
+    start: str,
+    end: Optional[str] = None,
+    interval: Optional[str] = "1D",
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    raise_errors: bool = True,
+    concat: bool = False,
+    compact: bool = False,
+):
+    """
+    Coroutine version of history_many(), with the same parameters.
+
+    Await it from code already running an event loop (async code,
+    Jupyter/Colab), where history_many() cannot start its own.
+    """
+    calls = {
+        symbol: {
+            "symbol": symbol,
+            "asset_type": asset_type,
+            "start": start,
+            "end": end,
+            "interval": interval,
+            "compact": compact,
+        }
+        for symbol in symbols
+    }
+    frames = await http_session.gather_limited(
+        history, calls, concurrency, rate_limit, raise_errors
+    )
+    if concat:
+        df = pd.concat(frames.values(), ignore_index=True)
+        if compact:
+            # Categoricals with different categories concatenate as object
+            df = df.astype({col: "category" for col in ["name", "category", "source"]})
+        return df
+    return frames
+
+
+def history_many(
+    symbols: List[str],
+    asset_type: str,
+    start: str,
+    end: Optional[str] = None,
+    interval: Optional[str] = "1D",
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    raise_errors: bool = True,
+    concat: bool = False,
+    compact: bool = False,
+):
+    """
+    Fetch history for many symbols concurrently.
+
+    This starts its own event loop; inside a running one, await
+    history_many_async() instead.
+
+    Parameters:
+        - symbols: ticker symbols; the other history parameters apply to all.
+        - concurrency: maximum number of requests in flight.
+        - rate_limit: maximum number of requests started per second.
+        - raise_errors: if False, symbols that fail are left out.
+        - concat: if True, return one long-format DataFrame
+            (one row per symbol and bar, identified by the `name` column)
+            instead of a dict of symbol -> DataFrame.
+        - compact: if True, return the compact float32/uint32/categorical schema.
+    """
+    http_session.require_no_running_loop("history_many()", "history_many_async()")
+    return asyncio.run(
+        history_many_async(
+            symbols=symbols,
             asset_type=asset_type,
+            start=start,
+            end=end,
             interval=interval,
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+            raise_errors=raise_errors,
+            concat=concat,
+            compact=compact,
         )
-
-        return df
+    )
 
 
 def _as_df(
@@ -169,10 +343,14 @@ def _as_df(
     asset_type: str,
     interval: str,
     floating: Optional[int] = 2,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
     Converts stock price history data from JSON format to DataFrame.
 
+    The payload is already columnar, so each column is built as a typed
+    NumPy array, scaled and rounded in place, and the frame is built once.
+
     Parameters:
         - history_data: Stock price history data in JSON format.
     Returns:
@@ -181,33 +359,22 @@ def _as_df(
     if not history_data:
         raise ValueError("Input data is empty or not provided.")
 
-    # Select and rename columns directly using a dictionary comprehension
-    columns_of_interest = {
-        key: _OHLC_MAP[key] for key in _OHLC_MAP.keys() & history_data.keys()
-    }
-    df = pd.DataFrame(history_data)[columns_of_interest.keys()].rename(
-        columns=_OHLC_MAP
-    )
-    # rearrange columns by open, high, low, close, volume, time
-    df = df[["time", "open", "high", "low", "close", "volume"]]
-
-    # Ensure 'time' column data are numeric (integers), then convert to datetime
-    df["time"] = pd.to_datetime(df["time"].astype(int), unit="s").dt.tz_localize(
-        "UTC"
-    )  # Localize the original time to UTC
-    # Convert UTC time to Asia/Ho_Chi_Minh timezone, make sure time is correct for minute and hour interval
-    df["time"] = df["time"].dt.tz_convert("Asia/Ho_Chi_Minh")
-
-    if asset_type not in ["index", "derivative"]:
-        # divide open, high, low, close, volume by 1000
-        df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].div(
-            1000
-        )
+    # Timestamps are UTC seconds; Asia/Ho_Chi_Minh is a fixed UTC+7 offset,
+    # so local wall time is a plain shift.
+    seconds = np.array(history_data["t"], dtype="int64") + _LOCAL_UTC_OFFSET
+    columns = {"time": (seconds * 1_000_000_000).astype("datetime64[ns]")}
 
-    # round open, high, low, close to 2 decimal places
-    df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].round(
-        floating
-    )
+    for key in ["o", "h", "l", "c"]:
+        prices = np.array(history_data[key], dtype="float64")
+        if asset_type not in ["index", "derivative"]:
+            # divide open, high, low, close by 1000
+            prices /= 1000
+        # round open, high, low, close to 2 decimal places
+        columns[_OHLC_MAP[key]] = np.round(prices, floating, out=prices)
+
+    columns["volume"] = np.array(history_data["v"], dtype=_OHLC_DTYPE["volume"])
+
+    df = pd.DataFrame(columns, copy=False)
 
     # if resolution is not in 1m, 1H, 1D, resample the data
     if interval not in ["1m", "1H", "1D"]:
@@ -224,19 +391,26 @@ def _as_df(
                 }
             )
             .reset_index()
+            .astype(_OHLC_DTYPE)
         )
-
-    # set datatype for each column using _OHLC_DTYPE
-    for col, dtype in _OHLC_DTYPE.items():
-        if dtype == "datetime64[ns]":
-            df[col] = df[col].dt.tz_localize(None)  # Remove timezone information
-            if interval == "1D":
-                df[col] = df[col].dt.date
-        df[col] = df[col].astype(dtype)
+    elif interval == "1D":
+        df["time"] = df["time"].dt.normalize()
 
     # Set metadata attributes
     df["name"] = symbol
     df["category"] = asset_type
     df["source"] = "VCI"
 
+    if compact:
+        df = _compact(df)
+
     return df
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast a history frame to the compact schema."""
+    dtype = dict(_COMPACT_DTYPE)
+    if len(df) and df["volume"].max() > np.iinfo("uint32").max:
+        # Summed volume of weekly/monthly index bars can overflow uint32
+        dtype["volume"] = _OHLC_DTYPE["volume"]
+    return df.astype(dtype)
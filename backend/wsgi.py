@@ -0,0 +1,18 @@
+"""
+Long-lived WSGI entry point.
+
+cgi_app.py starts a new interpreter for every request and imports pandas,
+requests and the ta package each time. Under a WSGI server those imports
+happen once per worker, and the in-process response cache stays warm:
+
+    gunicorn --preload --workers 2 --chdir backend wsgi:application
+
+Both the Flask routes (/signals) and the CGI style (/?action=signals) are
+served, so either API_BASE_URL from configs.json works.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask_app import app as application  # noqa: E402
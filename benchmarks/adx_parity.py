@@ -0,0 +1,92 @@
+"""
+Check that ta.trend.ADXIndicator matches the loop implementation it replaced.
+
+The reference is the frozen copy in benchmarks/legacy.py. Every case runs
+both with fillna on and off: random OHLC for windows 3 and 14, the same with
+NaN gaps, and series of no more than `window` bars.
+
+    python benchmarks/adx_parity.py            # exit status 1 on mismatch
+"""
+import numpy as np
+import pandas as pd
+
+import legacy  # puts backend/ on sys.path
+from ta.trend import ADXIndicator
+
+WINDOWS = [3, 14]
+OUTPUTS = ["adx", "adx_pos", "adx_neg"]
+
+
+def ohlc(bars, seed, gaps=False):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars))),
+        index=pd.date_range("2024-01-01", periods=bars, freq="h"),
+    )
+    high = close * (1 + np.abs(rng.normal(0, 0.005, bars)))
+    low = close * (1 - np.abs(rng.normal(0, 0.005, bars)))
+    if gaps:
+        for column in [high, low, close]:
+            column.iloc[rng.choice(bars, bars // 50, replace=False)] = np.nan
+        close.iloc[:5] = np.nan
+    return high, low, close
+
+
+def _outputs(indicator, high, low, close, window, fillna):
+    try:
+        adx = indicator(high, low, close, window, fillna)
+        return {name: getattr(adx, name)() for name in OUTPUTS}
+    except Exception as error:
+        return error
+
+
+def compare(label, high, low, close, window, fillna):
+    expected = _outputs(legacy.ADXIndicator, high, low, close, window, fillna)
+    actual = _outputs(ADXIndicator, high, low, close, window, fillna)
+
+    if isinstance(expected, Exception):
+        # Too few bars: the old loops raised, sometimes with an IndexError
+        # from running off their arrays. Raising the same way, or returning
+        # full-length output, both count as matching.
+        same_error = type(actual) is type(expected)
+        full_length = not isinstance(actual, Exception) and all(
+            len(series) == len(close) for series in actual.values()
+        )
+        failures = [] if same_error or full_length else [f"raised {actual!r}"]
+    elif isinstance(actual, Exception):
+        failures = [f"raised {actual!r}"]
+    else:
+        failures = []
+        for name in OUTPUTS:
+            try:
+                pd.testing.assert_series_equal(
+                    actual[name], expected[name], check_exact=False, rtol=1e-9
+                )
+            except AssertionError as error:
+                failures.append(f"{name}: {str(error).splitlines()[0]}")
+
+    status = "FAIL" if failures else "ok"
+    print(
+        f"{status:<4} {label:<14} window={window:<3} fillna={fillna!s:<5} "
+        f"{'; '.join(failures)}"
+    )
+    return not failures
+
+
+def main():
+    results = []
+    for window in WINDOWS:
+        for fillna in [False, True]:
+            results.append(compare("random", *ohlc(2000, 1), window, fillna))
+            results.append(
+                compare("nan gaps", *ohlc(2000, 2, gaps=True), window, fillna)
+            )
+            for bars in range(1, window + 1):
+                results.append(
+                    compare(f"{bars} bars", *ohlc(bars, 3), window, fillna)
+                )
+    raise SystemExit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Check tcbs.history_many against a local mock TCBS server.
+
+The server answers every symbol with the same bars after a short delay and
+records how many requests are in flight and when each one starts. The
+checks cover the concurrency and rate limits, raise_errors, and calling
+history_many_async() from code that already runs an event loop.
+
+    python benchmarks/history_many.py            # exit status 1 on failure
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+sys.path.insert(0, BACKEND)
+
+import tcbs  # noqa: E402
+
+# Seconds each mock request takes, long enough for requests to overlap
+DELAY = 0.05
+
+_BARS = json.dumps(
+    {
+        "data": [
+            {
+                "tradingDate": f"2024-01-{day:02d}T00:00:00.000Z",
+                "open": 1000.0,
+                "high": 1010.0,
+                "low": 990.0,
+                "close": 1005.0,
+                "volume": 100,
+            }
+            for day in range(1, 21)
+        ]
+    }
+).encode()
+
+
+class _MockTCBS(BaseHTTPRequestHandler):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    starts = []
+
+    @classmethod
+    def reset(cls):
+        cls.in_flight = cls.peak = 0
+        cls.starts = []
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+            cls.starts.append(time.perf_counter())
+        time.sleep(DELAY)
+        with cls.lock:
+            cls.in_flight -= 1
+
+        ticker = parse_qs(urlparse(self.path).query)["ticker"][0]
+        # 404 is not retried, so a bad symbol fails at once
+        status, body = (404, b"{}") if ticker == "BAD" else (200, _BARS)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def check(name, passed, detail):
+    print(f"{'ok' if passed else 'FAIL':<4} {name:<28} {detail}")
+    return passed
+
+
+def run_checks():
+    symbols = [f"S{i:02d}" for i in range(40)]
+    results = []
+
+    _MockTCBS.reset()
+    started = time.perf_counter()
+    frames = tcbs.history_many(symbols, "stock", concurrency=8)
+    elapsed = time.perf_counter() - started
+    results.append(
+        check(
+            "concurrency=8",
+            len(frames) == 40 and _MockTCBS.peak == 8,
+            f"{len(frames)} frames, peak {_MockTCBS.peak} in flight, {elapsed:.2f}s",
+        )
+    )
+
+    _MockTCBS.reset()
+    tcbs.history_many(symbols[:10], "stock", concurrency=10, rate_limit=20)
+    spread = _MockTCBS.starts[-1] - _MockTCBS.starts[0]
+    results.append(
+        check("rate_limit=20", spread >= 0.45 * 0.95, f"10 starts over {spread:.2f}s")
+    )
+
+    frames = tcbs.history_many(["S00", "BAD"], "stock", raise_errors=False)
+    results.append(
+        check("raise_errors=False", list(frames) == ["S00"], f"kept {list(frames)}")
+    )
+    try:
+        tcbs.history_many(["S00", "BAD"], "stock")
+        raised = "nothing"
+    except ConnectionError as error:
+        raised = type(error).__name__
+    results.append(
+        check("raise_errors=True", raised == "ConnectionError", f"raised {raised}")
+    )
+
+    async def inside_event_loop():
+        frames = await tcbs.history_many_async(symbols[:5], "stock", concat=True)
+        try:
+            tcbs.history_many(symbols[:5], "stock")
+            sync_error = "nothing"
+        except RuntimeError:
+            sync_error = "RuntimeError"
+        return frames, sync_error
+
+    frames, sync_error = asyncio.run(inside_event_loop())
+    results.append(
+        check(
+            "history_many_async in a loop",
+            len(frames) == 100 and sync_error == "RuntimeError",
+            f"{len(frames)} rows; sync history_many raised {sync_error}",
+        )
+    )
+    return results
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockTCBS)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    tcbs._BASE_URL = f"http://127.0.0.1:{server.server_port}"
+    try:
+        results = run_checks()
+    finally:
+        server.shutdown()
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Check that lightweight entry points stay cheap to import.
+
+Each module is imported in a fresh interpreter with ``-X importtime``. The
+check fails if the import pulls in a heavy dependency or takes longer than
+its budget, and prints the slowest imports to show what regressed.
+
+    python benchmarks/importtime.py            # exit status 1 on regression
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+
+# module -> (budget in ms, modules it must not import)
+CHECKS = {
+    "handlers": (150, ["pandas", "numpy", "requests", "numba", "ta"]),
+    "ta": (20, ["pandas", "numpy", "numba"]),
+    "ta.trend": (2000, ["numba", "ta.wrapper", "ta.volume", "ta.volatility"]),
+}
+
+
+def import_times(module):
+    """{imported module: cumulative microseconds} for a fresh `import module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def check(module, budget_ms, forbidden, scale):
+    times = import_times(module)
+    total_ms = times[module] / 1000
+    failures = [f"imports {name}" for name in forbidden if name in times]
+    if total_ms > budget_ms * scale:
+        failures.append(f"took {total_ms:.1f} ms, budget {budget_ms * scale:.0f} ms")
+
+    status = "FAIL" if failures else "ok"
+    print(f"{status:<4} {module:<10} {total_ms:8.1f} ms  {'; '.join(failures)}")
+    if failures:
+        slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)
+        for name, cumulative in slowest[1:6]:
+            print(f"{'':<16}{cumulative / 1000:8.1f} ms  {name}")
+    return not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply every time budget, for slow machines",
+    )
+    args = parser.parse_args()
+
+    results = [
+        check(module, budget_ms, forbidden, args.scale)
+        for module, (budget_ms, forbidden) in CHECKS.items()
+    ]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Time ATR, KAMA and ADX against the loop implementations they replaced.
+
+Each indicator runs on the same random OHLC series three ways: the frozen
+loops in benchmarks/legacy.py, the current code with its numpy fallback, and
+the current code with numba. numba is compiled before timing starts, and
+its results are checked against the loops.
+
+    python benchmarks/indicators.py --bars 100000
+"""
+import argparse
+import importlib.util
+import time
+
+import numpy as np
+import pandas as pd
+
+import legacy  # puts backend/ on sys.path
+import ta.utils
+from ta.momentum import KAMAIndicator
+from ta.trend import ADXIndicator
+from ta.volatility import AverageTrueRange
+
+
+def ohlc(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars))),
+        index=pd.date_range("2000-01-01", periods=bars, freq="h"),
+    )
+    high = close * (1 + np.abs(rng.normal(0, 0.005, bars)))
+    low = close * (1 - np.abs(rng.normal(0, 0.005, bars)))
+    return high, low, close
+
+
+def cases(high, low, close):
+    """name -> (module with the classes, function returning the output)"""
+    return {
+        "ATR": lambda m: m.AverageTrueRange(high, low, close, 14).average_true_range(),
+        "KAMA": lambda m: m.KAMAIndicator(close, 10, 2, 30).kama(),
+        "ADX": lambda m: m.ADXIndicator(high, low, close, 14).adx(),
+    }
+
+
+class _Current:
+    """The current classes, looked up like the ones in legacy."""
+
+    AverageTrueRange = AverageTrueRange
+    KAMAIndicator = KAMAIndicator
+    ADXIndicator = ADXIndicator
+
+
+def timed(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    has_numba = importlib.util.find_spec("numba") is not None
+    print(f"{args.bars} bars, best of {args.repeat}; numba installed: {has_numba}")
+    print(f"{'':<6}{'loops':>10}{'numpy':>10}{'numba':>10}{'speedup':>18}")
+
+    for name, run in cases(*ohlc(args.bars)).items():
+        loops, expected = timed(lambda: run(legacy), 1)
+
+        ta.utils._HAS_NUMBA = False
+        numpy_seconds, result = timed(lambda: run(_Current), args.repeat)
+        np.testing.assert_allclose(result, expected, rtol=1e-9, equal_nan=True)
+
+        row = f"{name:<6}{loops:>9.3f}s{numpy_seconds:>9.3f}s"
+        speedups = f"{loops / numpy_seconds:.0f}x"
+        if has_numba:
+            ta.utils._HAS_NUMBA = True
+            run(_Current)  # compile outside the timing
+            numba_seconds, result = timed(lambda: run(_Current), args.repeat)
+            np.testing.assert_allclose(result, expected, rtol=1e-9, equal_nan=True)
+            row += f"{numba_seconds:>9.3f}s"
+            speedups += f" / {loops / numba_seconds:.0f}x"
+        else:
+            row += f"{'-':>10}"
+        print(f"{row}{speedups:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Frozen copies of indicator implementations replaced by faster versions.
+
+They are kept verbatim, loops included, as references for the parity checks
+and benchmarks in this directory. Nothing in backend/ imports them.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+sys.path.insert(0, BACKEND)
+
+from ta.utils import IndicatorMixin, _get_min_max  # noqa: E402
+
+
+class ADXIndicator(IndicatorMixin):
+    """Average Directional Movement Index (ADX)
+
+    The Plus Directional Indicator (+DI) and Minus Directional Indicator (-DI)
+    are derived from smoothed averages of these differences, and measure trend
+    direction over time. These two indicators are often referred to
+    collectively as the Directional Movement Indicator (DMI).
+
+    The Average Directional Index (ADX) is in turn derived from the smoothed
+    averages of the difference between +DI and -DI, and measures the strength
+    of the trend (regardless of direction) over time.
+
+    Using these three indicators together, chartists can determine both the
+    direction and strength of the trend.
+
+    http://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:average_directional_index_adx
+
+    Args:
+        high(pandas.Series): dataset 'High' column.
+        low(pandas.Series): dataset 'Low' column.
+        close(pandas.Series): dataset 'Close' column.
+        window(int): n period.
+        fillna(bool): if True, fill nan values.
+    """
+
+    def __init__(
+        self,
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        window: int = 14,
+        fillna: bool = False,
+    ):
+        self._high = high
+        self._low = low
+        self._close = close
+        self._window = window
+        self._fillna = fillna
+        self._run()
+
+    def _run(self):
+        if self._window == 0:
+            raise ValueError("window may not be 0")
+
+        close_shift = self._close.shift(1)
+
+        pdm = _get_min_max(self._high, close_shift, "max")
+        pdn = _get_min_max(self._low, close_shift, "min")
+
+        diff_directional_movement = pdm - pdn
+
+        self._trs_initial = np.zeros(self._window - 1)
+        self._trs = np.zeros(len(self._close) - (self._window - 1))
+        self._trs[0] = diff_directional_movement.dropna().iloc[0 : self._window].sum()
+        diff_directional_movement = diff_directional_movement.reset_index(drop=True)
+
+        for i in range(1, len(self._trs) - 1):
+            self._trs[i] = (
+                self._trs[i - 1]
+                - (self._trs[i - 1] / float(self._window))
+                + diff_directional_movement[self._window + i]
+            )
+
+        diff_up = self._high - self._high.shift(1)
+        diff_down = self._low.shift(1) - self._low
+
+        pos = abs(((diff_up > diff_down) & (diff_up > 0)) * diff_up)
+        neg = abs(((diff_down > diff_up) & (diff_down > 0)) * diff_down)
+
+        self._dip = np.zeros(len(self._close) - (self._window - 1))
+        self._dip[0] = pos.dropna().iloc[0 : self._window].sum()
+
+        pos = pos.reset_index(drop=True)
+
+        for i in range(1, len(self._dip) - 1):
+            self._dip[i] = (
+                self._dip[i - 1]
+                - (self._dip[i - 1] / float(self._window))
+                + pos[self._window + i]
+            )
+
+        self._din = np.zeros(len(self._close) - (self._window - 1))
+        self._din[0] = neg.dropna().iloc[0 : self._window].sum()
+
+        neg = neg.reset_index(drop=True)
+
+        for i in range(1, len(self._din) - 1):
+            self._din[i] = (
+                self._din[i - 1]
+                - (self._din[i - 1] / float(self._window))
+                + neg[self._window + i]
+            )
+
+    def adx(self) -> pd.Series:
+        """Average Directional Index (ADX)
+
+        Returns:
+            pandas.Series: New feature generated.tr
+        """
+        dip = np.zeros(len(self._trs))
+
+        for idx, value in enumerate(self._trs):
+            if value != 0:
+                dip[idx] = 100 * (self._dip[idx] / value)
+
+            else:
+                dip[idx] = 0
+
+        din = np.zeros(len(self._trs))
+
+        for idx, value in enumerate(self._trs):
+            if value != 0:
+                din[idx] = 100 * (self._din[idx] / value)
+
+            else:
+                din[idx] = 0
+
+        directional_index = np.zeros(len(self._trs))
+
+        for idx in range(len(self._trs)):
+            if dip[idx] + din[idx] != 0:
+                directional_index[idx] = 100 * np.abs(
+                    (dip[idx] - din[idx]) / (dip[idx] + din[idx])
+                )
+
+            else:
+                directional_index[idx] = 0
+
+        adx_series = np.zeros(len(self._trs))
+        adx_series[self._window] = directional_index[0 : self._window].mean()
+
+        for i in range(self._window + 1, len(adx_series)):
+            adx_series[i] = (
+                (adx_series[i - 1] * (self._window - 1)) + directional_index[i - 1]
+            ) / float(self._window)
+
+        adx_series = np.concatenate((self._trs_initial, adx_series), axis=0)
+        adx_series = pd.Series(data=adx_series, index=self._close.index)
+        adx_series = self._check_fillna(adx_series, value=20)
+
+        return pd.Series(adx_series, name="adx")
+
+    def adx_pos(self) -> pd.Series:
+        """Plus Directional Indicator (+DI)
+
+        Returns:
+            pandas.Series: New feature generated.
+        """
+        dip = np.zeros(len(self._close))
+
+        for i in range(1, len(self._trs) - 1):
+            if self._trs[i] != 0:
+                dip[i + self._window] = 100 * (self._dip[i] / self._trs[i])
+
+            else:
+                dip[i + self._window] = 0
+
+        adx_pos_series = self._check_fillna(
+            pd.Series(dip, index=self._close.index), value=20
+        )
+
+        return pd.Series(adx_pos_series, name="adx_pos")
+
+    def adx_neg(self) -> pd.Series:
+        """Minus Directional Indicator (-DI)
+
+        Returns:
+            pandas.Series: New feature generated.
+        """
+        din = np.zeros(len(self._close))
+
+        for i in range(1, len(self._trs) - 1):
+            if self._trs[i] != 0:
+                din[i + self._window] = 100 * (self._din[i] / self._trs[i])
+
+            else:
+                din[i + self._window] = 0
+
+        adx_neg_series = self._check_fillna(
+            pd.Series(din, index=self._close.index), value=20
+        )
+
+        return pd.Series(adx_neg_series, name="adx_neg")
+
+
+class AverageTrueRange(IndicatorMixin):
+    """Average True Range (ATR)
+
+    The indicator provide an indication of the degree of price volatility.
+    Strong moves, in either direction, are often accompanied by large ranges,
+    or large True Ranges.
+
+    http://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:average_true_range_atr
+
+    Args:
+        high(pandas.Series): dataset 'High' column.
+        low(pandas.Series): dataset 'Low' column.
+        close(pandas.Series): dataset 'Close' column.
+        window(int): n period.
+        fillna(bool): if True, fill nan values.
+    """
+
+    def __init__(
+        self,
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        window: int = 14,
+        fillna: bool = False,
+    ):
+        self._high = high
+        self._low = low
+        self._close = close
+        self._window = window
+        self._fillna = fillna
+        self._run()
+
+    def _run(self):
+        close_shift = self._close.shift(1)
+        true_range = self._true_range(self._high, self._low, close_shift)
+        atr = np.zeros(len(self._close))
+        atr[self._window - 1] = true_range[0 : self._window].mean()
+        for i in range(self._window, len(atr)):
+            atr[i] = (atr[i - 1] * (self._window - 1) + true_range.iloc[i]) / float(
+                self._window
+            )
+        self._atr = pd.Series(data=atr, index=true_range.index)
+
+    def average_true_range(self) -> pd.Series:
+        """Average True Range (ATR)
+
+        Returns:
+            pandas.Series: New feature generated.
+        """
+        atr = self._check_fillna(self._atr, value=0)
+        return pd.Series(atr, name="atr")
+
+
+class KAMAIndicator(IndicatorMixin):
+    """Kaufman's Adaptive Moving Average (KAMA)
+
+    Moving average designed to account for market noise or volatility. KAMA
+    will closely follow prices when the price swings are relatively small and
+    the noise is low. KAMA will adjust when the price swings widen and follow
+    prices from a greater distance. This trend-following indicator can be
+    used to identify the overall trend, time turning points and filter price
+    movements.
+
+    https://www.tradingview.com/ideas/kama/
+
+    Args:
+        close(pandas.Series): dataset 'Close' column.
+        window(int): n period.
+        pow1(int): number of periods for the fastest EMA constant.
+        pow2(int): number of periods for the slowest EMA constant.
+        fillna(bool): if True, fill nan values.
+    """
+
+    def __init__(
+        self,
+        close: pd.Series,
+        window: int = 10,
+        pow1: int = 2,
+        pow2: int = 30,
+        fillna: bool = False,
+    ):
+        self._close = close
+        self._window = window
+        self._pow1 = pow1
+        self._pow2 = pow2
+        self._fillna = fillna
+        self._run()
+
+    def _run(self):
+        close_values = self._close.values
+        vol = pd.Series(abs(self._close - np.roll(self._close, 1)))
+
+        min_periods = 0 if self._fillna else self._window
+        er_num = abs(close_values - np.roll(close_values, self._window))
+        er_den = vol.rolling(self._window, min_periods=min_periods).sum()
+        efficiency_ratio = np.divide(
+            er_num, er_den, out=np.zeros_like(er_num), where=er_den != 0
+        )
+
+        smoothing_constant = (
+            (
+                efficiency_ratio * (2.0 / (self._pow1 + 1) - 2.0 / (self._pow2 + 1.0))
+                + 2 / (self._pow2 + 1.0)
+            )
+            ** 2.0
+        ).values
+
+        self._kama = np.zeros(smoothing_constant.size)
+        len_kama = len(self._kama)
+        first_value = True
+
+        for i in range(len_kama):
+            if np.isnan(smoothing_constant[i]):
+                self._kama[i] = np.nan
+            elif first_value:
+                self._kama[i] = close_values[i]
+                first_value = False
+            else:
+                self._kama[i] = self._kama[i - 1] + smoothing_constant[i] * (
+                    close_values[i] - self._kama[i - 1]
+                )
+
+    def kama(self) -> pd.Series:
+        """Kaufman's Adaptive Moving Average (KAMA)
+
+        Returns:
+            pandas.Series: New feature generated.
+        """
+        kama_series = pd.Series(self._kama, index=self._close.index)
+        kama_series = self._check_fillna(kama_series, value=self._close)
+        return pd.Series(kama_series, name="kama")
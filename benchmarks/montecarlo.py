@@ -0,0 +1,65 @@
+"""
+Time Monte Carlo resampling of the emamarsi trade list across processes.
+
+Bars come from builder.data_builder through the backend's bar store, and
+trades from trades.trade_list with the configured stop-loss and take-profit.
+
+    python benchmarks/montecarlo.py --bars 5000 --resamples 10000 --processes 4
+"""
+import argparse
+import os
+import sys
+import time
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+sys.path.insert(0, BACKEND)
+
+from barstore import BarStore  # noqa: E402
+from builder import data_builder  # noqa: E402
+from const import TYPE_DERIVATIVE  # noqa: E402
+from montecarlo import BOOTSTRAP, monte_carlo, monte_carlo_summary  # noqa: E402
+from trades import trade_list, trade_summary  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", default="tcbs")
+    parser.add_argument("--symbol", default="VN30F1M")
+    parser.add_argument("--asset-type", default=TYPE_DERIVATIVE)
+    parser.add_argument("--interval", default="1H")
+    parser.add_argument("--bars", type=int, default=5000)
+    parser.add_argument("--resamples", type=int, default=10000)
+    parser.add_argument("--method", default=BOOTSTRAP)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = data_builder(
+        args.source,
+        args.symbol,
+        args.asset_type,
+        args.bars,
+        -1,
+        args.interval,
+        5,
+        3,
+        14,
+        5,
+        store=BarStore(os.path.join(BACKEND, "bars")),
+    )
+    trades = trade_list(data)
+
+    started = time.perf_counter()
+    samples = monte_carlo(
+        trades, args.resamples, args.method, args.processes, args.seed
+    )
+    seconds = time.perf_counter() - started
+
+    print(f"{args.symbol} {args.interval}: {len(data)} bars, {len(trades)} trades")
+    print(f"observed: {trade_summary(trades)}")
+    print(f"{args.resamples} {args.method} resamples in {seconds:.2f} s")
+    print(monte_carlo_summary(samples).to_string(float_format="%.4f"))
+
+
+if __name__ == "__main__":
+    main()
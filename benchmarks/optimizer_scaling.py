@@ -0,0 +1,56 @@
+"""
+Report how the emamarsi grid optimizer scales with the number of processes.
+
+Bars come from builder.data_builder through the backend's bar store, so only
+bars missing from backend/bars are downloaded.
+
+    python benchmarks/optimizer_scaling.py --bars 1500 --processes 1 2 4 8
+"""
+import argparse
+import os
+import sys
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+sys.path.insert(0, BACKEND)
+
+from barstore import BarStore  # noqa: E402
+from builder import data_builder  # noqa: E402
+from const import TYPE_DERIVATIVE  # noqa: E402
+from optimizer import scaling_report  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", default="tcbs")
+    parser.add_argument("--symbol", default="VN30F1M")
+    parser.add_argument("--asset-type", default=TYPE_DERIVATIVE)
+    parser.add_argument("--interval", default="1H")
+    parser.add_argument("--bars", type=int, default=1500)
+    parser.add_argument("--processes", type=int, nargs="+")
+    args = parser.parse_args()
+
+    data = data_builder(
+        args.source,
+        args.symbol,
+        args.asset_type,
+        args.bars,
+        -1,
+        args.interval,
+        5,
+        3,
+        14,
+        5,
+        store=BarStore(os.path.join(BACKEND, "bars")),
+    )
+    grid = (range(3, 23), range(2, 17), range(7, 22, 2), range(3, 12, 2))
+    report = scaling_report(data.close, *grid, process_counts=args.processes)
+
+    combinations = 1
+    for windows in grid:
+        combinations *= len(windows)
+    print(f"{args.symbol} {args.interval}: {len(data)} bars, {combinations} combos")
+    print(report.to_string(index=False, float_format="%.2f"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare per-request latency of the CGI entry point with the WSGI worker.
+
+The CGI path runs backend/cgi_app.py in a new interpreter for each request,
+the way Apache does. The worker path imports backend/wsgi.py once, serves it
+from a local wsgiref server, and sends the same requests over HTTP.
+
+    python benchmarks/startup.py --action env --requests 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def _summary(label, timings):
+    timings_ms = [t * 1000 for t in timings]
+    print(
+        f"{label:<16} median {statistics.median(timings_ms):8.1f} ms"
+        f"   min {min(timings_ms):8.1f} ms   max {max(timings_ms):8.1f} ms"
+    )
+
+
+def bench_cgi(action, requests):
+    env = dict(os.environ, REQUEST_METHOD="GET", QUERY_STRING=f"action={action}")
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "cgi_app.py"],
+            cwd=BACKEND,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def bench_worker(action, requests):
+    started = time.perf_counter()
+    sys.path.insert(0, BACKEND)
+    from wsgi import application
+
+    import_time = time.perf_counter() - started
+
+    server = make_server("127.0.0.1", 0, application, handler_class=_QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/?action={action}"
+    timings = []
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            with urllib.request.urlopen(url) as response:
+                response.read()
+            timings.append(time.perf_counter() - started)
+    finally:
+        server.shutdown()
+    return import_time, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--action", default="env")
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    cgi = bench_cgi(args.action, args.requests)
+    import_time, worker = bench_worker(args.action, args.requests)
+
+    print(f"action={args.action}, {args.requests} requests each")
+    _summary("cgi", cgi)
+    _summary("wsgi worker", worker)
+    print(f"{'worker startup':<16} {import_time * 1000:8.1f} ms (once per worker)")
+    speedup = statistics.median(cgi) / statistics.median(worker)
+    print(f"speedup          {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()